@@ -5,9 +5,12 @@ __copyright__ = 'Copyright (c) 2019-2023, Utrecht University'
 __license__   = 'GPLv3, see LICENSE'
 __author__    = ('Lazlo Westerhof, Jelmer Zondergeld')
 
+import copy
+import hashlib
 import json
 import re
 import time
+# OrderedDict keeps API result and link key order stable: dicts are unordered on Python 2
 from collections import OrderedDict
 from datetime import datetime
 from enum import Enum
@@ -62,8 +65,17 @@ __all__ = ['api_datarequest_roles_get',
 
 DATAREQUESTSTATUSATTRNAME = "status"
 
+# Attribute on the data requests collection holding the next free request ID
+NEXTREQUESTIDATTRNAME = constants.UUORGMETADATAPREFIX + "datarequest_next_request_id"
+
+# Attribute on datarequest.json holding the hash of the contents its AVUs were last synced with
+CONTENTHASHATTRNAME = constants.UUORGMETADATAPREFIX + "datarequest_content_hash"
+
 YODA_PORTAL_FQDN  = config.yoda_portal_fqdn
 
+# Base URL of the data request pages of the portal, linked to from emails
+DATAREQUEST_URL   = "https://{}/datarequest".format(YODA_PORTAL_FQDN)
+
 JSON_EXT          = ".json"
 
 SCHEMACOLLECTION  = constants.UUSYSTEMCOLLECTION + "/datarequest/schemas"
@@ -72,10 +84,18 @@ SCHEMA_VERSION    = "youth-1"
 SCHEMA            = "schema"
 UISCHEMA          = "uischema"
 
+# Matches the schema ID of a data request, capturing its schema version
+SCHEMA_ID_PATTERN = re.compile(re.escape(SCHEMA_URI_PREFIX) + r'(.*)/datarequest/schema\.json')
+
 GROUP_DM          = "datarequests-research-datamanagers"
 GROUP_DAC         = "datarequests-research-data-access-committee"
 GROUP_PM          = "datarequests-research-project-managers"
 
+# Roles derived from group membership (role, group)
+GROUP_ROLES       = (("PM",  GROUP_PM),
+                     ("DM",  GROUP_DM),
+                     ("DAC", GROUP_DAC))
+
 DRCOLLECTION         = "home/datarequests-research"
 PROVENANCE           = "provenance"
 DATAREQUEST          = "datarequest"
@@ -91,6 +111,39 @@ FEEDBACK             = "feedback"
 DTA_PATHNAME         = "dta"
 SIGDTA_PATHNAME      = "signed_dta"
 
+# Initial permissions on the collection of a new data request and its subcollections
+# (access level, user). None denotes the researcher submitting the data request.
+INITIAL_ACLS     = [("read", GROUP_DM),
+                    ("read", GROUP_DAC),
+                    ("read", GROUP_PM),
+                    ("own",  "rods")]
+INITIAL_DTA_ACLS = [("read", GROUP_PM),
+                    ("read", GROUP_DM),
+                    ("read", None),
+                    ("own",  "rods")]
+
+# Prefix of the provenance log AVUs holding status transition timestamps (one per transition,
+# e.g. provenance:SUBMITTED). Use datarequest_provenance_get to read timestamps: it merges these
+# with the timestamps in provenance.json itself, written for data requests from before these AVUs
+PROVENANCE_ATTR_PREFIX = PROVENANCE + ":"
+
+# Matches ORDER_BY etc. wrappers around GenQuery column names
+COLUMN_WRAPPER = re.compile(r'.*\((.*)\)')
+
+# Path to the node of the assignment schema listing the DAC members a data request can be assigned to
+ASSIGNMENT_ENUM_PATH = ('dependencies', 'decision', 'oneOf', 0, 'properties', 'assign_to', 'items')
+
+# Maximum number of values in a single GenQuery "in" condition (condition strings are limited in size)
+GENQUERY_IN_CHUNK_SIZE = 20
+
+# Maximum length of the list of data object names passed in a single batched permission change
+# (they are passed through msiExecCmd, whose argument string is limited in size)
+PERMISSION_BATCH_MAX_LENGTH = 512
+
+# Maximum number of compiled schema validators and schemas kept in memory
+VALIDATOR_CACHE_SIZE = 64
+SCHEMA_CACHE_SIZE    = 32
+
 
 ###################################################
 #           Datarequest info functions            #
@@ -143,61 +196,88 @@ class status(Enum):
     DATA_READY                        = 'DATA_READY'
 
 
-# List of valid datarequest status transitions (source, destination)
-status_transitions = [(status(x),
-                       status(y))
-                      for x, y in [('IN_SUBMISSION',                     'DRAFT'),
-                                   ('IN_SUBMISSION',                     'PENDING_ATTACHMENTS'),
-                                   ('IN_SUBMISSION',                     'DAO_SUBMITTED'),
-                                   ('IN_SUBMISSION',                     'SUBMITTED'),
+# Mapping of status values to datarequest statuses (avoids Enum name lookups on every status fetch)
+_STATUS_BY_VALUE = {s.value: s for s in status}
 
-                                   ('DRAFT',                             'PENDING_ATTACHMENTS'),
-                                   ('DRAFT',                             'DAO_SUBMITTED'),
-                                   ('DRAFT',                             'SUBMITTED'),
 
-                                   ('PENDING_ATTACHMENTS',               'SUBMITTED'),
+# Status that each review decision moves a datarequest to, and whether the
+# decision comes with feedback for the researcher
+PR_REVIEW_DECISIONS  = {"Accepted for data manager review": (status.PRELIMINARY_ACCEPT,   False),
+                        "Rejected":                         (status.PRELIMINARY_REJECT,   True),
+                        "Rejected (resubmit)":              (status.PRELIMINARY_RESUBMIT, True)}
+DM_REVIEW_DECISIONS  = {"Accepted":                         (status.DATAMANAGER_ACCEPT,   False),
+                        "Rejected":                         (status.DATAMANAGER_REJECT,   False),
+                        "Rejected (resubmit)":              (status.DATAMANAGER_RESUBMIT, False)}
+ASSIGNMENT_DECISIONS = {"Accepted for review":              (status.UNDER_REVIEW,                      False),
+                        "Rejected":                         (status.REJECTED_AFTER_DATAMANAGER_REVIEW, True),
+                        "Rejected (resubmit)":              (status.RESUBMIT_AFTER_DATAMANAGER_REVIEW, True)}
+EVALUATION_DECISIONS = {"Approved":                         (status.APPROVED, False),
+                        "Rejected":                         (status.REJECTED, True),
+                        "Rejected (resubmit)":              (status.RESUBMIT, True)}
 
-                                   ('DAO_SUBMITTED',                     'DAO_APPROVED'),
-                                   ('DAO_SUBMITTED',                     'REJECTED'),
-                                   ('DAO_SUBMITTED',                     'RESUBMIT'),
+# Statuses resulting from each kind of review decision (the statuses the corresponding email
+# routines handle)
+PR_REVIEW_STATUSES  = frozenset(new_status for new_status, _ in PR_REVIEW_DECISIONS.values())
+DM_REVIEW_STATUSES  = frozenset(new_status for new_status, _ in DM_REVIEW_DECISIONS.values())
+ASSIGNMENT_STATUSES = frozenset(new_status for new_status, _ in ASSIGNMENT_DECISIONS.values())
+EVALUATION_STATUSES = frozenset(new_status for new_status, _ in EVALUATION_DECISIONS.values())
 
-                                   ('SUBMITTED',                         'PRELIMINARY_ACCEPT'),
-                                   ('SUBMITTED',                         'PRELIMINARY_REJECT'),
-                                   ('SUBMITTED',                         'PRELIMINARY_RESUBMIT'),
 
-                                   ('PRELIMINARY_ACCEPT',                'DATAMANAGER_ACCEPT'),
-                                   ('PRELIMINARY_ACCEPT',                'DATAMANAGER_REJECT'),
-                                   ('PRELIMINARY_ACCEPT',                'DATAMANAGER_RESUBMIT'),
+# Set of valid datarequest status transitions (source, destination)
+status_transitions = frozenset([(status(x),
+                                 status(y))
+                                for x, y in [('IN_SUBMISSION',                     'DRAFT'),
+                                             ('IN_SUBMISSION',                     'PENDING_ATTACHMENTS'),
+                                             ('IN_SUBMISSION',                     'DAO_SUBMITTED'),
+                                             ('IN_SUBMISSION',                     'SUBMITTED'),
 
-                                   ('DATAMANAGER_ACCEPT',                'UNDER_REVIEW'),
-                                   ('DATAMANAGER_ACCEPT',                'REJECTED_AFTER_DATAMANAGER_REVIEW'),
-                                   ('DATAMANAGER_ACCEPT',                'RESUBMIT_AFTER_DATAMANAGER_REVIEW'),
-                                   ('DATAMANAGER_REJECT',                'UNDER_REVIEW'),
-                                   ('DATAMANAGER_REJECT',                'REJECTED_AFTER_DATAMANAGER_REVIEW'),
-                                   ('DATAMANAGER_REJECT',                'RESUBMIT_AFTER_DATAMANAGER_REVIEW'),
-                                   ('DATAMANAGER_RESUBMIT',              'UNDER_REVIEW'),
-                                   ('DATAMANAGER_RESUBMIT',              'REJECTED_AFTER_DATAMANAGER_REVIEW'),
-                                   ('DATAMANAGER_RESUBMIT',              'RESUBMIT_AFTER_DATAMANAGER_REVIEW'),
+                                             ('DRAFT',                             'PENDING_ATTACHMENTS'),
+                                             ('DRAFT',                             'DAO_SUBMITTED'),
+                                             ('DRAFT',                             'SUBMITTED'),
 
-                                   ('UNDER_REVIEW',                      'REVIEWED'),
+                                             ('PENDING_ATTACHMENTS',               'SUBMITTED'),
 
-                                   ('REVIEWED',                          'APPROVED'),
-                                   ('REVIEWED',                          'REJECTED'),
-                                   ('REVIEWED',                          'RESUBMIT'),
+                                             ('DAO_SUBMITTED',                     'DAO_APPROVED'),
+                                             ('DAO_SUBMITTED',                     'REJECTED'),
+                                             ('DAO_SUBMITTED',                     'RESUBMIT'),
 
-                                   ('RESUBMIT',                          'RESUBMITTED'),
-                                   ('PRELIMINARY_RESUBMIT',              'RESUBMITTED'),
-                                   ('RESUBMIT_AFTER_DATAMANAGER_REVIEW', 'RESUBMITTED'),
+                                             ('SUBMITTED',                         'PRELIMINARY_ACCEPT'),
+                                             ('SUBMITTED',                         'PRELIMINARY_REJECT'),
+                                             ('SUBMITTED',                         'PRELIMINARY_RESUBMIT'),
 
-                                   ('APPROVED',                          'PREREGISTRATION_SUBMITTED'),
-                                   ('PREREGISTRATION_SUBMITTED',         'PREREGISTRATION_CONFIRMED'),
+                                             ('PRELIMINARY_ACCEPT',                'DATAMANAGER_ACCEPT'),
+                                             ('PRELIMINARY_ACCEPT',                'DATAMANAGER_REJECT'),
+                                             ('PRELIMINARY_ACCEPT',                'DATAMANAGER_RESUBMIT'),
 
-                                   ('PREREGISTRATION_CONFIRMED',         'DTA_READY'),
-                                   ('DAO_APPROVED',                      'DTA_READY'),
+                                             ('DATAMANAGER_ACCEPT',                'UNDER_REVIEW'),
+                                             ('DATAMANAGER_ACCEPT',                'REJECTED_AFTER_DATAMANAGER_REVIEW'),
+                                             ('DATAMANAGER_ACCEPT',                'RESUBMIT_AFTER_DATAMANAGER_REVIEW'),
+                                             ('DATAMANAGER_REJECT',                'UNDER_REVIEW'),
+                                             ('DATAMANAGER_REJECT',                'REJECTED_AFTER_DATAMANAGER_REVIEW'),
+                                             ('DATAMANAGER_REJECT',                'RESUBMIT_AFTER_DATAMANAGER_REVIEW'),
+                                             ('DATAMANAGER_RESUBMIT',              'UNDER_REVIEW'),
+                                             ('DATAMANAGER_RESUBMIT',              'REJECTED_AFTER_DATAMANAGER_REVIEW'),
+                                             ('DATAMANAGER_RESUBMIT',              'RESUBMIT_AFTER_DATAMANAGER_REVIEW'),
 
-                                   ('DTA_READY',                         'DTA_SIGNED'),
+                                             ('UNDER_REVIEW',                      'REVIEWED'),
 
-                                   ('DTA_SIGNED',                        'DATA_READY')]]
+                                             ('REVIEWED',                          'APPROVED'),
+                                             ('REVIEWED',                          'REJECTED'),
+                                             ('REVIEWED',                          'RESUBMIT'),
+
+                                             ('RESUBMIT',                          'RESUBMITTED'),
+                                             ('PRELIMINARY_RESUBMIT',              'RESUBMITTED'),
+                                             ('RESUBMIT_AFTER_DATAMANAGER_REVIEW', 'RESUBMITTED'),
+
+                                             ('APPROVED',                          'PREREGISTRATION_SUBMITTED'),
+                                             ('PREREGISTRATION_SUBMITTED',         'PREREGISTRATION_CONFIRMED'),
+
+                                             ('PREREGISTRATION_CONFIRMED',         'DTA_READY'),
+                                             ('DAO_APPROVED',                      'DTA_READY'),
+
+                                             ('DTA_READY',                         'DTA_SIGNED'),
+
+                                             ('DTA_SIGNED',                        'DATA_READY')]])
 
 
 def status_transition_allowed(ctx, current_status, new_status):
@@ -224,38 +304,78 @@ def status_get_from_path(ctx, path):
 
     :returns: Status of given data request
     """
-    temp, _ = pathutil.chop(path)
-    _, request_id = pathutil.chop(temp)
+    # The request ID is the name of the parent collection of the data object at the given path
+    request_id = path.rsplit('/', 2)[-2]
 
     return status_get(ctx, request_id)
 
 
-def status_get(ctx, request_id):
+def datarequest_avus_get(ctx, request_id):
+    """Get all AVUs of a data request in a single query
+
+    The reviewers of the data request are derived from the same result, so that subsequent
+    reviewer and role lookups need no queries of their own.
+
+    :param ctx:        Combined type of a callback and rei struct
+    :param request_id: Unique identifier of the data request
+
+    :returns: Dict mapping attribute names to lists of values
+    """
+    cache = _ctx_cache(ctx)
+    key = ('avus', str(request_id))
+    if key not in cache:
+        coll_path = _dr_coll_path(ctx, request_id)
+        rows = list(row_iterator(["META_DATA_ATTR_NAME", "META_DATA_ATTR_VALUE"],
+                                 "COLL_NAME = '{}' AND DATA_NAME = '{}'".format(coll_path, DATAREQUEST + JSON_EXT),
+                                 AS_DICT, ctx))
+
+        avus = {}
+        for row in rows:
+            avus.setdefault(row['META_DATA_ATTR_NAME'], []).append(row['META_DATA_ATTR_VALUE'])
+        cache[key] = avus
+        cache[('reviewers', str(request_id))] = [row for row in rows if row['META_DATA_ATTR_NAME']
+                                                 in ('assignedForReview', 'reviewedBy')]
+
+    return cache[key]
+
+
+def status_get(ctx, request_id, avus=None):
     """Get the status of a data request
 
     :param ctx:        Combined type of a callback and rei struct
     :param request_id: Unique identifier of the data request
+    :param avus:       AVUs of the data request as returned by datarequest_avus_get (optional, saves
+                       a query if already retrieved)
 
     :raises UUError: Status could not be retrieved
 
     :returns: Status of given data request
     """
-    # Construct filename and filepath
-    coll_path = "/{}/{}/{}".format(user.zone(ctx), DRCOLLECTION, request_id)
-    file_name = DATAREQUEST + JSON_EXT
+    if avus is not None:
+        rows = [{'META_DATA_ATTR_VALUE': value} for value in avus.get(DATAREQUESTSTATUSATTRNAME, [])]
+    else:
+        # Construct filename and filepath
+        coll_path = _dr_coll_path(ctx, request_id)
+        file_name = DATAREQUEST + JSON_EXT
+
+        # Retrieve current status
+        rows = row_iterator(["META_DATA_ATTR_VALUE"],
+                            ("COLL_NAME = '{}' AND DATA_NAME = '{}' AND META_DATA_ATTR_NAME = 'status'").format(coll_path, file_name),
+                            AS_DICT, ctx)
+
+    # Fetch at most two rows in a single pass over the result set
+    it     = iter(rows)
+    first  = next(it, None)
+    second = next(it, None)
 
-    # Retrieve current status
-    rows = row_iterator(["META_DATA_ATTR_VALUE"],
-                        ("COLL_NAME = '{}' AND DATA_NAME = '{}' AND META_DATA_ATTR_NAME = 'status'").format(coll_path, file_name),
-                        AS_DICT, ctx)
-    if rows.total_rows() == 1:
-        return status[list(rows)[0]['META_DATA_ATTR_VALUE']]
     # If no status is set, set status to IN_SUBMISSION (this is the case for newly submitted data
     # requests)
-    elif rows.total_rows() == 0:
+    if first is None:
         return status.IN_SUBMISSION
-    else:
+    elif second is not None:
         raise error.UUError("Could not unambiguously determine the current status for datarequest <{}>".format(request_id))
+    else:
+        return _STATUS_BY_VALUE[first['META_DATA_ATTR_VALUE']]
 
 
 def type_get(ctx, request_id):
@@ -267,7 +387,7 @@ def type_get(ctx, request_id):
     :returns: Type of given data request
     """
     # Get datarequest
-    datarequest = json.loads(datarequest_get(ctx, request_id))
+    datarequest = _json_get(ctx, datarequest_get, request_id)
 
     # Determine if draft
     if datarequest['draft']:
@@ -283,52 +403,217 @@ def type_get(ctx, request_id):
     return datarequest_type
 
 
+# Documents that exist for a data request, given its (type, status)
+documents_by_status = {(datarequest_type.value, datarequest_status.value): documents
+                       for datarequest_type, statuses, documents in [
+                           (type.REGULAR, [status.DRAFT],
+                            ()),
+                           (type.REGULAR, [status.SUBMITTED, status.PENDING_ATTACHMENTS],
+                            (DATAREQUEST,)),
+                           (type.REGULAR, [status.PRELIMINARY_ACCEPT, status.PRELIMINARY_REJECT, status.PRELIMINARY_RESUBMIT],
+                            (DATAREQUEST, PR_REVIEW)),
+                           (type.REGULAR, [status.DATAMANAGER_ACCEPT, status.DATAMANAGER_REJECT, status.DATAMANAGER_RESUBMIT],
+                            (DATAREQUEST, PR_REVIEW, DM_REVIEW)),
+                           (type.REGULAR, [status.UNDER_REVIEW, status.REJECTED_AFTER_DATAMANAGER_REVIEW, status.RESUBMIT_AFTER_DATAMANAGER_REVIEW],
+                            (DATAREQUEST, PR_REVIEW, DM_REVIEW, ASSIGNMENT)),
+                           (type.REGULAR, [status.REVIEWED],
+                            (DATAREQUEST, PR_REVIEW, DM_REVIEW, ASSIGNMENT, REVIEW)),
+                           (type.REGULAR, [status.APPROVED, status.REJECTED, status.RESUBMIT, status.RESUBMITTED],
+                            (DATAREQUEST, PR_REVIEW, DM_REVIEW, ASSIGNMENT, REVIEW, EVALUATION)),
+                           (type.REGULAR, [status.PREREGISTRATION_SUBMITTED, status.PREREGISTRATION_CONFIRMED, status.DTA_READY, status.DTA_SIGNED, status.DATA_READY],
+                            (DATAREQUEST, PR_REVIEW, DM_REVIEW, ASSIGNMENT, REVIEW, EVALUATION, PREREGISTRATION)),
+                           (type.DAO, [status.DAO_SUBMITTED],
+                            (DATAREQUEST,)),
+                           (type.DAO, [status.DAO_APPROVED, status.DTA_READY, status.DTA_SIGNED, status.DATA_READY],
+                            (DATAREQUEST, EVALUATION))]
+                       for datarequest_status in statuses}
+
+# Documents a user is permitted to read, given their role (in order of precedence)
+documents_by_role = [("OWN", frozenset([DATAREQUEST, PREREGISTRATION])),
+                     ("PM",  frozenset([DATAREQUEST, PR_REVIEW, DM_REVIEW, ASSIGNMENT, REVIEW, EVALUATION, PREREGISTRATION])),
+                     ("DM",  frozenset([DATAREQUEST, PR_REVIEW, DM_REVIEW])),
+                     ("REV", frozenset([DATAREQUEST, PR_REVIEW, DM_REVIEW, ASSIGNMENT, REVIEW, EVALUATION]))]
+
+
 def available_documents_get(ctx, request_id, datarequest_type, datarequest_status):
 
     # Construct list of existing documents
-    available_documents = []
-    if datarequest_type == type.REGULAR.value:
-        if datarequest_status == status.DRAFT.value:
-            available_documents = []
-        elif datarequest_status in [status.SUBMITTED.value, status.PENDING_ATTACHMENTS.value]:
-            available_documents = [DATAREQUEST]
-        elif datarequest_status in [status.PRELIMINARY_ACCEPT.value, status.PRELIMINARY_REJECT.value, status.PRELIMINARY_RESUBMIT.value]:
-            available_documents = [DATAREQUEST, PR_REVIEW]
-        elif datarequest_status in [status.DATAMANAGER_ACCEPT.value, status.DATAMANAGER_REJECT.value, status.DATAMANAGER_RESUBMIT.value]:
-            available_documents = [DATAREQUEST, PR_REVIEW, DM_REVIEW]
-        elif datarequest_status in [status.UNDER_REVIEW.value, status.REJECTED_AFTER_DATAMANAGER_REVIEW.value, status.RESUBMIT_AFTER_DATAMANAGER_REVIEW.value]:
-            available_documents = [DATAREQUEST, PR_REVIEW, DM_REVIEW, ASSIGNMENT]
-        elif datarequest_status == status.REVIEWED.value:
-            available_documents = [DATAREQUEST, PR_REVIEW, DM_REVIEW, ASSIGNMENT, REVIEW]
-        elif datarequest_status in [status.APPROVED.value, status.REJECTED.value, status.RESUBMIT.value, status.RESUBMITTED.value]:
-            available_documents = [DATAREQUEST, PR_REVIEW, DM_REVIEW, ASSIGNMENT, REVIEW, EVALUATION]
-        elif datarequest_status in [status.PREREGISTRATION_SUBMITTED.value, status.PREREGISTRATION_CONFIRMED.value, status.DTA_READY.value, status.DTA_SIGNED.value, status.DATA_READY.value]:
-            available_documents = [DATAREQUEST, PR_REVIEW, DM_REVIEW, ASSIGNMENT, REVIEW, EVALUATION, PREREGISTRATION]
-    elif datarequest_type == type.DAO.value:
-        if datarequest_status == status.DAO_SUBMITTED.value:
-            available_documents = [DATAREQUEST]
-        elif datarequest_status in [status.DAO_APPROVED.value, status.DTA_READY.value, status.DTA_SIGNED.value, status.DATA_READY.value]:
-            available_documents = [DATAREQUEST, EVALUATION]
+    available_documents = documents_by_status.get((datarequest_type, datarequest_status), ())
 
     # Filter out documents which the user is not permitted to read
     roles = datarequest_roles_get(ctx, request_id)
-    if "OWN" in roles:
-        allowed_documents = [DATAREQUEST, PREREGISTRATION]
-    elif "PM" in roles:
-        allowed_documents = [DATAREQUEST, PR_REVIEW, DM_REVIEW, ASSIGNMENT, REVIEW, EVALUATION, PREREGISTRATION]
-    elif "DM" in roles:
-        allowed_documents = [DATAREQUEST, PR_REVIEW, DM_REVIEW]
-    elif "REV" in roles:
-        allowed_documents = [DATAREQUEST, PR_REVIEW, DM_REVIEW, ASSIGNMENT, REVIEW, EVALUATION]
-    available_documents = [value for value in available_documents if value in allowed_documents]
+    allowed_documents = next((documents for role, documents in documents_by_role if role in roles),
+                             frozenset())
 
-    return available_documents
+    return [value for value in available_documents if value in allowed_documents]
 
 
 ###################################################
 #                 Helper functions                #
 ###################################################
 
+def _ctx_cache(ctx):
+    """Get a dict for memoizing lookups during a single rule invocation
+
+    A new Context is constructed for every rule invocation, so values stored here never outlive
+    the API call or policy that computed them.
+
+    :param ctx: Combined type of a callback and rei struct
+
+    :returns: Dict with memoized lookups
+    """
+    return ctx.__dict__.setdefault('_datarequest_cache', {})
+
+
+def _user_info_get(ctx, key, get):
+    """Get information on the invoking user (memoized for the duration of the rule invocation)
+
+    :param ctx: Combined type of a callback and rei struct
+    :param key: Cache key of the information
+    :param get: Function retrieving the information (e.g. user.name)
+
+    :returns: Requested information
+    """
+    cache = _ctx_cache(ctx)
+    if key not in cache:
+        cache[key] = get(ctx)
+
+    return cache[key]
+
+
+def _zone(ctx):
+    """Get the zone of the invoking user"""
+    return _user_info_get(ctx, 'zone', user.zone)
+
+
+def _user_name(ctx):
+    """Get the name of the invoking user"""
+    return _user_info_get(ctx, 'user_name', user.name)
+
+
+def _user_full_name(ctx):
+    """Get the name and zone of the invoking user, formatted as a 'x#y' string"""
+    return _user_info_get(ctx, 'user_full_name', user.full_name)
+
+
+def _dr_coll_path(ctx, request_id=None, *components):
+    """Get the path to the collection of a data request, or to a file or subcollection within it
+
+    :param ctx:        Combined type of a callback and rei struct
+    :param request_id: Unique identifier of the data request (if omitted, the path to the
+                       collection containing all data requests is returned)
+    :param components: Path components below the data request collection (e.g. DTA_PATHNAME,
+                       filename)
+
+    :returns: Path
+    """
+    coll = "/{}/{}".format(_zone(ctx), DRCOLLECTION)
+    if request_id is None:
+        return coll
+
+    return "/".join((coll, str(request_id)) + components)
+
+
+def _user_groups_get(ctx):
+    """Get the names of all groups the invoking user is a member of
+
+    :param ctx: Combined type of a callback and rei struct
+
+    :returns: Set of group names
+    """
+    cache = _ctx_cache(ctx)
+    if 'groups' not in cache:
+        cache['groups'] = frozenset(row[0] for row in
+                                    row_iterator("USER_GROUP_NAME",
+                                                 "USER_NAME = '{}' AND USER_ZONE = '{}'".format(*user.user_and_zone(ctx)),
+                                                 AS_LIST, ctx))
+
+    return cache['groups']
+
+
+def _group_members_get(ctx, group_name):
+    """Get the members of a group (memoized for the duration of the rule invocation)
+
+    :param ctx:        Combined type of a callback and rei struct
+    :param group_name: Name of the group
+
+    :returns: List of (user name, zone) tuples
+    """
+    cache = _ctx_cache(ctx)
+    key = ('group_members', group_name)
+    if key not in cache:
+        cache[key] = list(group.members(ctx, group_name))
+
+    return cache[key]
+
+
+def _member_emails(ctx, group_name):
+    """Get the email addresses (user names) of the members of a group
+
+    :param ctx:        Combined type of a callback and rei struct
+    :param group_name: Name of the group
+
+    :returns: List of email addresses
+    """
+    return [member for member, _ in _group_members_get(ctx, group_name)]
+
+
+def _mail_group(ctx, emails, **kwargs):
+    """Send a single mail to a group of recipients, who are not disclosed to each other
+
+    :param ctx:    Combined type of a callback and rei struct
+    :param emails: List of email addresses of the recipients (names that are not an email address,
+                   e.g. rods, are skipped)
+    :param kwargs: Other arguments of mail.send
+
+    :returns: API status
+    """
+    emails = [address for address in emails if '@' in address]
+    if emails:
+        return mail.send(ctx, to=emails[0], bcc=emails[1:], **kwargs)
+
+
+def _pm_email(ctx):
+    """Get the email address of the project manager that is the contact for researchers
+
+    :param ctx: Combined type of a callback and rei struct
+
+    :returns: Email address (user name) of the first project manager other than rods
+    """
+    return next(member for member, _ in _group_members_get(ctx, GROUP_PM) if member != "rods")
+
+
+def _json_get(ctx, get, request_id):
+    """Get the parsed contents of a data request document (memoized for the duration of the rule
+    invocation)
+
+    The returned object is shared between callers and must not be modified.
+
+    :param ctx:        Combined type of a callback and rei struct
+    :param get:        Function retrieving the document as JSON (e.g. datarequest_get)
+    :param request_id: Unique identifier of the data request
+
+    :returns: Parsed document
+    """
+    cache = _ctx_cache(ctx)
+    key = ('json', get.__name__, str(request_id))
+    if key not in cache:
+        cache[key] = json.loads(get(ctx, request_id))
+
+    return cache[key]
+
+
+def _metadata_cache_clear(ctx, request_id):
+    """Forget memoized metadata (AVUs, reviewers) of a data request after it has been changed
+
+    :param ctx:        Combined type of a callback and rei struct
+    :param request_id: Unique identifier of the data request
+    """
+    cache = _ctx_cache(ctx)
+    cache.pop(('avus', str(request_id)), None)
+    cache.pop(('reviewers', str(request_id)), None)
+
+
 def metadata_set(ctx, request_id, key, value):
     """Set an arbitrary metadata field on a data request
 
@@ -337,30 +622,71 @@ def metadata_set(ctx, request_id, key, value):
     :param key:        Key of the metadata field
     :param value:      Value of the metadata field
     """
+    metadata_set_many(ctx, [(request_id, key, value)])
+
+
+def metadata_set_many(ctx, changes):
+    """Set arbitrary metadata fields on one or more data requests
+
+    The processing of delayed rules is triggered once for all changes. As only one metadata change
+    can be pending per data request, processing is also triggered before a data request is changed
+    for the second time.
+
+    :param ctx:     Combined type of a callback and rei struct
+    :param changes: List of (request ID, key, value) tuples, applied in order
+    """
+    pending = set()
+    for request_id, key, value in changes:
+        request_id = str(request_id)
+
+        # Trigger the processing of delayed rules if a change is already pending for this request
+        if request_id in pending:
+            ctx.adminDatarequestActions()
+            pending.clear()
 
-    # Construct path to the collection of the data request
-    coll_path = "/{}/{}/{}".format(user.zone(ctx), DRCOLLECTION, request_id)
+        # Construct path to the collection of the data request
+        coll_path = _dr_coll_path(ctx, request_id)
 
-    # Add delayed rule to update data request status
-    response_status = ""
-    response_status_info = ""
-    ctx.requestDatarequestMetadataChange(coll_path, key, value, "0", response_status,
-                                         response_status_info)
+        # Add delayed rule to update data request metadata
+        response_status = ""
+        response_status_info = ""
+        ctx.requestDatarequestMetadataChange(coll_path, key, value, "0", response_status,
+                                             response_status_info)
+        _metadata_cache_clear(ctx, request_id)
+        pending.add(request_id)
 
     # Trigger the processing of delayed rules
-    ctx.adminDatarequestActions()
+    if pending:
+        ctx.adminDatarequestActions()
 
 
 def generate_request_id(ctx):
-    coll           = "/{}/{}".format(user.zone(ctx), DRCOLLECTION)
-    max_request_id = 0
-
-    # Find highest request ID currently in use
-    for current_collection in collection.subcollections(ctx, coll, recursive=False):
-        if str.isdigit(pathutil.basename(current_collection)) and int(pathutil.basename(current_collection)) > max_request_id:
-            max_request_id = int(pathutil.basename(current_collection))
+    coll = _dr_coll_path(ctx)
+
+    # Use the request ID counter on the data requests collection, provided that it points to an
+    # unused request ID ...
+    next_request_id = Query(ctx, "META_COLL_ATTR_VALUE",
+                            "COLL_NAME = '{}' AND META_COLL_ATTR_NAME = '{}'".format(coll, NEXTREQUESTIDATTRNAME)).first()
+    if next_request_id is not None and next_request_id.isdigit() \
+       and not collection.exists(ctx, "{}/{}".format(coll, next_request_id)):
+        request_id = int(next_request_id)
+    else:
+        # ... else (i.e. counter not yet initialized or out of sync) find highest request ID
+        # currently in use
+        max_request_id = 0
+        for current_collection in collection.subcollections(ctx, coll, recursive=False):
+            current_request_id = pathutil.basename(current_collection)
+            if current_request_id.isdigit() and int(current_request_id) > max_request_id:
+                max_request_id = int(current_request_id)
+        request_id = max_request_id + 1
+
+    # Advance the counter. Failure is not fatal, the next call falls back to a full scan.
+    try:
+        avu.set_on_coll(ctx, coll, NEXTREQUESTIDATTRNAME, str(request_id + 1))
+    except msi.Error as e:
+        log.write(ctx, "Could not update request ID counter of <{}>: {}".format(coll, e))
 
-    return max_request_id + 1
+    return request_id
 
 
 @api.make()
@@ -376,12 +702,12 @@ def api_datarequest_action_permitted(ctx, request_id, roles, statuses):
     :returns:            True if permitted, False if not
     :rtype:              Boolean
     """
+    # Force conversion of request_id to string
+    request_id = str(request_id)
 
-    # Convert statuses to list of status enumeration elements
+    # Convert statuses to set of status enumeration elements
     if statuses is not None:
-        def get_status(stat):
-            return status[stat]
-        statuses = map(get_status, statuses)
+        statuses = frozenset(_STATUS_BY_VALUE[stat] for stat in statuses)
 
     return datarequest_action_permitted(ctx, request_id, roles, statuses)
 
@@ -398,29 +724,17 @@ def datarequest_action_permitted(ctx, request_id, roles, statuses):
     :rtype:              Boolean
     """
     try:
-        # Force conversion of request_id to string
-        request_id = str(request_id)
-
         # Check status
         if ((statuses is not None) and (status_get(ctx, request_id) not in statuses)):
             return api.Error("permission_error", "Action not permitted: illegal status transition.")
 
         # Get current user roles
-        current_user_roles = []
-        if user.is_member_of(ctx, GROUP_PM):
-            current_user_roles.append("PM")
-        if user.is_member_of(ctx, GROUP_DM):
-            current_user_roles.append("DM")
-        if user.is_member_of(ctx, GROUP_DAC):
-            current_user_roles.append("DAC")
-        if datarequest_is_owner(ctx, request_id):
-            current_user_roles.append("OWN")
-        if datarequest_is_reviewer(ctx, request_id):
-            current_user_roles.append("REV")
+        roles = frozenset(roles)
+        current_user_roles = datarequest_roles_get(ctx, request_id, required_roles=roles)
 
         # Check user permissions (i.e. if at least 1 of the user's roles is on the permitted roles
         # list)
-        if len(set(current_user_roles) & set(roles)) < 1:
+        if roles.isdisjoint(current_user_roles):
             return api.Error("permission_error", "Action not permitted: insufficient user permissions.")
 
         # If both checks pass, user is permitted to perform action
@@ -443,29 +757,46 @@ def api_datarequest_roles_get(ctx, request_id=None):
     return datarequest_roles_get(ctx, request_id)
 
 
-def datarequest_roles_get(ctx, request_id):
+def datarequest_roles_get(ctx, request_id, required_roles=None):
     """Get roles of invoking user
 
-    :param ctx:        Combined type of a callback and rei struct
-    :param request_id: Unique identifier of the data request (OWN and REV roles will not be checked
-                       if this parameter is missing)
+    :param ctx:            Combined type of a callback and rei struct
+    :param request_id:     Unique identifier of the data request (OWN and REV roles will not be checked
+                           if this parameter is missing)
+    :param required_roles: Roles the caller is interested in (optional). If given, checks for roles
+                           not on this list are skipped and the roles are returned as soon as one of
+                           the required roles has been found
 
     :returns:          Array of user roles
     :rtype:            Array
     """
-    roles = []
-    if user.is_member_of(ctx, GROUP_PM):
-        roles.append("PM")
-    if user.is_member_of(ctx, GROUP_DM):
-        roles.append("DM")
-    if user.is_member_of(ctx, GROUP_DAC):
-        roles.append("DAC")
-    if request_id is not None and datarequest_is_owner(ctx, request_id):
+    if required_roles is not None:
+        required_roles = frozenset(required_roles)
+
+    def wanted(*candidates):
+        return required_roles is None or not required_roles.isdisjoint(candidates)
+
+    def found():
+        return required_roles is not None and not required_roles.isdisjoint(roles)
+
+    groups = _user_groups_get(ctx)
+    roles = [role for role, group_name in GROUP_ROLES if group_name in groups]
+    if request_id is None or found():
+        return roles
+
+    if wanted("OWN") and datarequest_is_owner(ctx, request_id):
         roles.append("OWN")
-    if request_id is not None and datarequest_is_reviewer(ctx, request_id):
-        roles.append("REV")
-    if request_id is not None and datarequest_is_reviewer(ctx, request_id, pending=True):
-        roles.append("PENREV")
+        if found():
+            return roles
+
+    if wanted("REV", "PENREV"):
+        # Pending reviewers and reviewers that have given their review come from a single query
+        username = _user_name(ctx)
+        if username in datarequest_reviewers_get(ctx, request_id):
+            roles.append("REV")
+        if username in datarequest_reviewers_get(ctx, request_id, pending=True):
+            roles.append("PENREV")
+
     return roles
 
 
@@ -478,7 +809,7 @@ def datarequest_is_owner(ctx, request_id):
     :return:           True if user_name is owner of specified data request else False
     :rtype:            bool
     """
-    return datarequest_owner_get(ctx, request_id) == user.name(ctx)
+    return datarequest_owner_get(ctx, request_id) == _user_name(ctx)
 
 
 def datarequest_owner_get(ctx, request_id):
@@ -491,12 +822,16 @@ def datarequest_owner_get(ctx, request_id):
     :return:           Account name of data request owner
     :rtype:            string
     """
-    # Construct path to the data request
-    file_path = "/{}/{}/{}/{}".format(user.zone(ctx), DRCOLLECTION, request_id, DATAREQUEST
-                                      + JSON_EXT)
+    cache = _ctx_cache(ctx)
+    key = ('owner', str(request_id))
+    if key not in cache:
+        # Get data request owner (from the memoized data request contents)
+        datarequest = datarequest_get(ctx, request_id)
+        if isinstance(datarequest, api.Error):
+            raise error.UUError(datarequest.info)
+        cache[key] = jsonutil.parse(datarequest)['owner']
 
-    # Get and return data request owner
-    return jsonutil.read(ctx, file_path)['owner']
+    return cache[key]
 
 
 def datarequest_is_reviewer(ctx, request_id, pending=False):
@@ -508,11 +843,8 @@ def datarequest_is_reviewer(ctx, request_id, pending=False):
 
     :returns: Boolean indicating if the user is assigned as reviewer
     """
-    # Force conversion of request_id to string
-    request_id = str(request_id)
-
     # Get username
-    username = user.name(ctx)
+    username = _user_name(ctx)
 
     # Get reviewers
     reviewers = datarequest_reviewers_get(ctx, request_id, pending)
@@ -533,28 +865,30 @@ def datarequest_reviewers_get(ctx, request_id, pending=False):
 
     :returns: List of reviewers
     """
-    # Declare variables needed for retrieving the list of reviewers
-    coll_path = "/{}/{}/{}".format(user.zone(ctx), DRCOLLECTION, request_id)
-    reviewers = []
-
-    # Retrieve list of reviewers (review pending)
-    rows = row_iterator(["META_DATA_ATTR_VALUE"],
-                        "COLL_NAME = '{}' AND DATA_NAME = '{}' AND META_DATA_ATTR_NAME = 'assignedForReview'".format(coll_path, DATAREQUEST + JSON_EXT),
-                        AS_DICT, ctx)
-    for row in rows:
-        reviewers.append(row['META_DATA_ATTR_VALUE'])
-
-    # Retrieve list of reviewers (review given)
+    cache = _ctx_cache(ctx)
+    key = ('reviewers', str(request_id))
+    if key not in cache:
+        # Declare variables needed for retrieving the list of reviewers
+        coll_path = _dr_coll_path(ctx, request_id)
+
+        # Retrieve list of reviewers (review pending and review given) in a single query
+        cache[key] = list(row_iterator(["META_DATA_ATTR_NAME", "META_DATA_ATTR_VALUE"],
+                                       "COLL_NAME = '{}' AND DATA_NAME = '{}' AND META_DATA_ATTR_NAME in ('assignedForReview', 'reviewedBy')".format(coll_path, DATAREQUEST + JSON_EXT),
+                                       AS_DICT, ctx))
+    rows = cache[key]
+
+    # Pending reviewers are listed before reviewers that have already given their review
+    reviewers = [row['META_DATA_ATTR_VALUE'] for row in rows if row['META_DATA_ATTR_NAME'] == 'assignedForReview']
     if not pending:
-        rows = row_iterator(["META_DATA_ATTR_VALUE"],
-                            "COLL_NAME = '{}' AND DATA_NAME = '{}' AND META_DATA_ATTR_NAME = 'reviewedBy'".format(coll_path, DATAREQUEST + JSON_EXT),
-                            AS_DICT, ctx)
-        for row in rows:
-            reviewers.append(row['META_DATA_ATTR_VALUE'])
+        reviewers += [row['META_DATA_ATTR_VALUE'] for row in rows if row['META_DATA_ATTR_NAME'] == 'reviewedBy']
 
     return reviewers
 
 
+# Cache of datarequest form schemas, keyed by (schema collection path, schema name)
+_schemas = {}
+
+
 @api.make()
 def api_datarequest_schema_get(ctx, schema_name, version=SCHEMA_VERSION):
     return datarequest_schema_get(ctx, schema_name, version)
@@ -570,21 +904,38 @@ def datarequest_schema_get(ctx, schema_name, version=SCHEMA_VERSION):
     :returns: Dict with schema and UI schema
     """
     # Define paths to schema and uischema
-    coll_path = "/{}{}/{}".format(user.zone(ctx), SCHEMACOLLECTION, version)
+    coll_path = "/{}{}/{}".format(_zone(ctx), SCHEMACOLLECTION, version)
     schema_path = "{}/{}/{}".format(coll_path, schema_name, SCHEMA + JSON_EXT)
     uischema_path = "{}/{}/{}".format(coll_path, schema_name, UISCHEMA + JSON_EXT)
 
-    # Retrieve and read schema and uischema
-    try:
-        schema = jsonutil.read(ctx, schema_path)
-        uischema = jsonutil.read(ctx, uischema_path)
-    except error.UUFileNotExistError:
-        return api.Error("file_read_error", "Could not read schema because it doesn't exist.")
+    # Retrieve and read schema and uischema (schemas are static per version, so they are read only
+    # once). Callers must not alter the returned schemas, as they are shared through the cache.
+    key = (coll_path, schema_name)
+    if key not in _schemas:
+        try:
+            schema = jsonutil.read(ctx, schema_path)
+            uischema = jsonutil.read(ctx, uischema_path)
+        except error.UUFileNotExistError:
+            return api.Error("file_read_error", "Could not read schema because it doesn't exist.")
+
+        if len(_schemas) >= SCHEMA_CACHE_SIZE:
+            _schemas.clear()
+        _schemas[key] = (schema, uischema)
+    schema, uischema = _schemas[key]
 
     # Return JSON with schema and uischema
     return {"schema": schema, "uischema": uischema}
 
 
+def schemas_cache_clear():
+    """Clear the caches of datarequest form schemas and their compiled validators
+
+    Call this after changing schemas in place (i.e. without bumping the schema version).
+    """
+    _schemas.clear()
+    _validators.clear()
+
+
 @api.make()
 def api_datarequest_resubmission_id_get(ctx, request_id):
     """Given a request ID, get the request ID of the associated resubmitted data request
@@ -594,8 +945,9 @@ def api_datarequest_resubmission_id_get(ctx, request_id):
 
     :returns:              String containing the request ID of the resubmitted data request
     """
-    coll      = "/{}/{}".format(user.zone(ctx), DRCOLLECTION)
-    coll_path = list(Query(ctx, ['COLL_NAME'], "COLL_PARENT_NAME = '{}' AND DATA_NAME = '{}' AND META_DATA_ATTR_NAME = 'previous_request_id' AND META_DATA_ATTR_VALUE in '{}'".format(coll, DATAREQUEST + JSON_EXT, request_id), output=AS_DICT))
+    coll      = _dr_coll_path(ctx)
+    # Two rows suffice to tell whether there is exactly one match
+    coll_path = list(Query(ctx, ['COLL_NAME'], "COLL_PARENT_NAME = '{}' AND DATA_NAME = '{}' AND META_DATA_ATTR_NAME = 'previous_request_id' AND META_DATA_ATTR_VALUE in '{}'".format(coll, DATAREQUEST + JSON_EXT, request_id), output=AS_DICT, limit=2))
     if len(coll_path) == 1:
         # We're extracting the request ID from the pathname of the collection as that's the most
         # straightforward way of getting it, and is also stable.
@@ -614,7 +966,7 @@ def datarequest_provenance_write(ctx, request_id, request_status):
     :returns:              Nothing
     """
     # Check if request ID is valid
-    if re.search("^\d+$", request_id) is None:
+    if not request_id.isdigit():
         return api.Error("input_error", "Invalid request ID supplied: {}.".format(request_id))
 
     # Check if status parameter is valid
@@ -622,27 +974,50 @@ def datarequest_provenance_write(ctx, request_id, request_status):
         return api.Error("input_error", "Invalid status parameter supplied: {}.".format(request_status.value))
 
     # Construct path to provenance log
-    coll_path       = "/{}/{}/{}".format(user.zone(ctx), DRCOLLECTION, request_id)
+    coll_path       = _dr_coll_path(ctx, request_id)
     provenance_path = "{}/{}".format(coll_path, PROVENANCE + JSON_EXT)
 
-    # Get timestamps
-    timestamps = jsonutil.read(ctx, provenance_path)
-
     # Check if there isn't already a timestamp for the given status
-    if request_status.value in timestamps:
+    if request_status.value in datarequest_provenance_get(ctx, request_id):
         return api.Error("input_error", "Status ({}) has already been timestamped.".format(request_status.value))
 
-    # Add timestamp
-    current_time = str(datetime.now().strftime('%s'))
-    timestamps[request_status.value] = current_time
-
-    # Write timestamp to provenance log
+    # Append timestamp to provenance log (one AVU per transition on the provenance log, so no
+    # rewrite of the log is needed)
+    current_time = str(int(time.time()))
     try:
-        jsonutil.write(ctx, provenance_path, timestamps)
-    except error.UUError as e:
+        avu.associate_to_data(ctx, provenance_path, PROVENANCE_ATTR_PREFIX + request_status.value,
+                              current_time)
+    except msi.Error as e:
         return api.Error("write_error", "Could not write timestamp to provenance log: {}.".format(e))
 
 
+def datarequest_provenance_get(ctx, request_id):
+    """Get the timestamps of the status transitions of a data request
+
+    :param ctx:        Combined type of a callback and rei struct
+    :param request_id: Unique identifier of the data request
+
+    :returns: Dict mapping statuses to the timestamp at which they were first reached
+    """
+    # Construct path to provenance log
+    coll_path       = _dr_coll_path(ctx, request_id)
+    provenance_path = "{}/{}".format(coll_path, PROVENANCE + JSON_EXT)
+
+    # Timestamps written before provenance was logged as AVUs are in the log itself
+    timestamps = jsonutil.read(ctx, provenance_path)
+
+    # Merge timestamps logged as AVUs, keeping the earliest timestamp of each status
+    for attr, value in row_iterator(["META_DATA_ATTR_NAME", "META_DATA_ATTR_VALUE"],
+                                    "COLL_NAME = '{}' AND DATA_NAME = '{}' AND META_DATA_ATTR_NAME like '{}%'".format(
+                                        coll_path, PROVENANCE + JSON_EXT, PROVENANCE_ATTR_PREFIX),
+                                    AS_LIST, ctx):
+        status_value = attr[len(PROVENANCE_ATTR_PREFIX):]
+        if status_value not in timestamps or int(value) < int(timestamps[status_value]):
+            timestamps[status_value] = value
+
+    return timestamps
+
+
 def datarequest_data_valid(ctx, data, schema_name=False, schema=False):
     """Check if form data contains no errors
 
@@ -672,19 +1047,89 @@ def datarequest_data_valid(ctx, data, schema_name=False, schema=False):
                          "No schema specified (neither a schema name nor a schema was given).")
 
     try:
-        schema = datarequest_schema_get(ctx, schema_name)['schema'] if schema_name else schema
-
-        validator = jsonschema.Draft7Validator(schema)
-
-        errors = list(validator.iter_errors(data))
+        validator = _validator_get(ctx, schema_name) if schema_name else _validator_get_from_schema(schema)
 
-        return len(errors) == 0
+        return validator.is_valid(data)
     except error.UUJsonValidationError:
         # File may be missing or not valid JSON
         return api.Error("validation_error",
                          "{} form data could not be validated against its schema.".format(schema_name))
 
 
+# Compiled schema validators, keyed by (schema name, version) or by digest of the schema itself.
+_validators = {}
+
+
+def _validator_cache(key, get_schema):
+    """Get a compiled validator from the cache, compiling and storing it on a miss
+
+    :param key:        Cache key of the validator
+    :param get_schema: Function returning the schema to compile when the key is not cached
+
+    :returns: Compiled Draft 7 validator
+    """
+    validator = _validators.get(key)
+    if validator is None:
+        # Bound memory use; validators are cheap to recompile after a flush.
+        if len(_validators) >= VALIDATOR_CACHE_SIZE:
+            _validators.clear()
+        # Validators generating Python code per schema (e.g. fastjsonschema) would be faster still,
+        # but require Python 3. Consider switching when we can use Python 3 in the ruleset
+        # (iRODS 4.3.x).
+        validator = _validators[key] = jsonschema.Draft7Validator(get_schema())
+
+    return validator
+
+
+def _validator_get(ctx, schema_name, version=SCHEMA_VERSION):
+    """Get the compiled validator of a datarequest form schema
+
+    :param ctx:         Combined type of a callback and rei struct
+    :param schema_name: Name of schema
+    :param version:     Version of schema
+
+    :returns: Compiled Draft 7 validator
+    """
+    return _validator_cache((schema_name, version),
+                            lambda: datarequest_schema_get(ctx, schema_name, version)['schema'])
+
+
+def _validator_get_assignment(ctx, dac_members):
+    """Get the compiled validator of the assignment form schema for a given list of DAC members
+
+    The DAC members to which a data request can be assigned are inserted into the assignment schema
+    when the form is rendered, so the schema has to be altered in the same way for validation.
+
+    :param ctx:         Combined type of a callback and rei struct
+    :param dac_members: List of DAC members to which the data request can be assigned
+
+    :returns: Compiled Draft 7 validator
+    """
+    def get_schema():
+        # Copy only the nodes along the path to the DAC members, as the cached schema is shared
+        schema = node = copy.copy(datarequest_schema_get(ctx, ASSIGNMENT)['schema'])
+        for key in ASSIGNMENT_ENUM_PATH:
+            node[key] = copy.copy(node[key])
+            node = node[key]
+        node['enum']      = dac_members
+        node['enumNames'] = dac_members
+        return schema
+
+    return _validator_cache((ASSIGNMENT, SCHEMA_VERSION, tuple(sorted(dac_members))), get_schema)
+
+
+def _validator_get_from_schema(schema):
+    """Get the compiled validator of a (dynamically altered) schema
+
+    :param schema: JSON schema
+
+    :returns: Compiled Draft 7 validator
+    """
+    digest = hashlib.sha1(json.dumps(schema, sort_keys=True)).hexdigest()
+
+    return _validator_cache(digest, lambda: schema)
+
+
 def cc_email_addresses_get(contact_object):
     try:
         cc = contact_object['cc_email_addresses']
@@ -695,12 +1140,21 @@ def cc_email_addresses_get(contact_object):
 
 @rule.make(inputs=range(0), outputs=range(2))
 def rule_datarequest_review_period_expiration_check(ctx):
-    coll       = "/{}/{}".format(user.zone(ctx), DRCOLLECTION)
-    criteria = "COLL_PARENT_NAME = '{}' AND DATA_NAME = '{}' AND META_DATA_ATTR_NAME = 'endOfReviewPeriod' AND META_DATA_ATTR_VALUE < '{}' AND META_DATA_ATTR_NAME = 'status' AND META_DATA_ATTR_VALUE = 'UNDER_REVIEW'".format(coll, DATAREQUEST + JSON_EXT, int(time.time()))
-    ccols    = ['COLL_NAME']
-    qcoll    = Query(ctx, ccols, criteria, output=AS_DICT)
-    if len(list(qcoll)) > 0:
-        datarequest_process_expired_review_periods(ctx, [result['COLL_NAME'].split('/')[-1] for result in list(qcoll)])
+    coll = _dr_coll_path(ctx)
+
+    # A single AVU cannot match both the endOfReviewPeriod and the status attribute, so first
+    # find the data requests with an expired review period ...
+    criteria = "COLL_PARENT_NAME = '{}' AND DATA_NAME = '{}' AND META_DATA_ATTR_NAME = 'endOfReviewPeriod' AND META_DATA_ATTR_VALUE < '{}'".format(coll, DATAREQUEST + JSON_EXT, int(time.time()))
+    expired = set(row[0] for row in row_iterator("COLL_NAME", criteria, AS_LIST, ctx))
+    if not expired:
+        return
+
+    # ... and then keep those that are still under review
+    criteria = "COLL_PARENT_NAME = '{}' AND DATA_NAME = '{}' AND META_DATA_ATTR_NAME = 'status' AND META_DATA_ATTR_VALUE = 'UNDER_REVIEW'".format(coll, DATAREQUEST + JSON_EXT)
+    request_ids = [row[0].split('/')[-1] for row in row_iterator("COLL_NAME", criteria, AS_LIST, ctx)
+                   if row[0] in expired]
+    if request_ids:
+        datarequest_process_expired_review_periods(ctx, request_ids)
 
 
 def datarequest_sync_avus(ctx, request_id):
@@ -727,12 +1181,23 @@ def datarequest_sync_avus(ctx, request_id):
         raise error.UUError('request_id is not a digit.')
 
     # Get request data
-    coll_path = "/{}/{}/{}".format(user.zone(ctx), DRCOLLECTION, request_id)
+    coll_path = _dr_coll_path(ctx, request_id)
     file_path = "{}/{}".format(coll_path, DATAREQUEST + JSON_EXT)
     data = datarequest_get(ctx, request_id)
+    if isinstance(data, api.Error):
+        raise error.UUError(data.info)
+
+    # Skip resynchronization if the contents did not change since the AVUs were last set
+    content_hash = hashlib.sha256(data).hexdigest()
+    synced_hash  = Query(ctx, "META_DATA_ATTR_VALUE",
+                         "COLL_NAME = '{}' AND DATA_NAME = '{}' AND META_DATA_ATTR_NAME = '{}'".format(
+                             coll_path, DATAREQUEST + JSON_EXT, CONTENTHASHATTRNAME)).first()
+    if synced_hash == content_hash:
+        return
 
     # Re-set the AVUs
     avu_json.set_json_to_obj(ctx, file_path, "-d", "root", data)
+    avu.set_on_data(ctx, file_path, CONTENTHASHATTRNAME, content_hash)
 
 
 ###################################################
@@ -741,7 +1206,7 @@ def datarequest_sync_avus(ctx, request_id):
 
 @api.make()
 def api_datarequest_browse(ctx, sort_on='name', sort_order='asc', offset=0, limit=10,
-                           archived=False, dacrequests=True):
+                           archived=False, dacrequests=False):
     """Get paginated datarequests, including size/modify date information.
 
     :param ctx:         Combined type of a callback and rei struct
@@ -756,36 +1221,18 @@ def api_datarequest_browse(ctx, sort_on='name', sort_order='asc', offset=0, limi
 
     :returns:           Dict with paginated datarequests
     """
-    # Convert parameters that couldn't be passed as actual boolean values to booleans
-    archived    = archived == "True"
-    dacrequests = dacrequests == "True"
-
-    dac_member = user.is_member_of(ctx, GROUP_DAC)
-    coll       = "/{}/{}".format(user.zone(ctx), DRCOLLECTION)
+    dac_member = GROUP_DAC in _user_groups_get(ctx)
+    coll       = _dr_coll_path(ctx)
 
     def transform(row):
         # Remove ORDER_BY etc. wrappers from column names.
-        x = {re.sub('.*\((.*)\)', '\\1', k): v for k, v in row.items()}
+        x = {k if '(' not in k else COLUMN_WRAPPER.sub(r'\1', k): v for k, v in row.items()}
 
         return {'id':          x['COLL_NAME'].split('/')[-1],
                 'name':        x['COLL_OWNER_NAME'],
                 'create_time': int(x['COLL_CREATE_TIME']),
                 'status':      x['META_DATA_ATTR_VALUE']}
 
-    def transform_title(row):
-        # Remove ORDER_BY etc. wrappers from column names.
-        x = {re.sub('.*\((.*)\)', '\\1', k): v for k, v in row.items()}
-
-        return {'id':          x['COLL_NAME'].split('/')[-1],
-                'title':       x['META_DATA_ATTR_VALUE']}
-
-    def transform_status(row):
-        # Remove ORDER_BY etc. wrappers from column names.
-        x = {re.sub('.*\((.*)\)', '\\1', k): v for k, v in row.items()}
-
-        return {'id':          x['COLL_NAME'].split('/')[-1],
-                'status':      x['META_DATA_ATTR_VALUE']}
-
     if sort_on == 'modified':
         # FIXME: Sorting on modify date is borked: There appears to be no
         # reliable way to filter out replicas this way - multiple entries for
@@ -813,55 +1260,51 @@ def api_datarequest_browse(ctx, sort_on='name', sort_order='asc', offset=0, limi
         criteria = "COLL_PARENT_NAME = '{}' AND DATA_NAME = '{}' AND META_DATA_ATTR_NAME = 'status' AND META_DATA_ATTR_VALUE = 'PRELIMINARY_REJECT' || = 'REJECTED_AFTER_DATAMANAGER_REVIEW' || = 'REJECTED' || = 'RESUBMITTED' || = 'DATA_READY'".format(coll, DATAREQUEST + JSON_EXT)
     # c1) DAC reviewable requests case
     elif dac_member and not dacrequests and not archived:
-        criteria = "COLL_PARENT_NAME = '{}' AND DATA_NAME = '{}' AND META_DATA_ATTR_NAME = 'assignedForReview' AND META_DATA_ATTR_VALUE in '{}'".format(coll, DATAREQUEST + JSON_EXT, user.name(ctx))
+        criteria = "COLL_PARENT_NAME = '{}' AND DATA_NAME = '{}' AND META_DATA_ATTR_NAME = 'assignedForReview' AND META_DATA_ATTR_VALUE in '{}'".format(coll, DATAREQUEST + JSON_EXT, _user_name(ctx))
     # c2) DAC own requests case
     elif dac_member and dacrequests and not archived:
-        criteria = "COLL_PARENT_NAME = '{}' AND DATA_NAME = '{}' AND META_DATA_ATTR_NAME = 'owner' AND META_DATA_ATTR_VALUE in '{}'".format(coll, DATAREQUEST + JSON_EXT, user.name(ctx))
+        criteria = "COLL_PARENT_NAME = '{}' AND DATA_NAME = '{}' AND META_DATA_ATTR_NAME = 'owner' AND META_DATA_ATTR_VALUE in '{}'".format(coll, DATAREQUEST + JSON_EXT, _user_name(ctx))
     # c3) DAC reviewed requests
     elif dac_member and not dacrequests and archived:
-        criteria = "COLL_PARENT_NAME = '{}' AND DATA_NAME = '{}' AND META_DATA_ATTR_NAME = 'reviewedBy' AND META_DATA_ATTR_VALUE in '{}'".format(coll, DATAREQUEST + JSON_EXT, user.name(ctx))
+        criteria = "COLL_PARENT_NAME = '{}' AND DATA_NAME = '{}' AND META_DATA_ATTR_NAME = 'reviewedBy' AND META_DATA_ATTR_VALUE in '{}'".format(coll, DATAREQUEST + JSON_EXT, _user_name(ctx))
+    else:
+        return api.Error("input_error", "Browsing archived data requests is not supported for a DAC member's own data requests.")
     #
     qcoll = Query(ctx, ccols, criteria, offset=offset, limit=limit, output=AS_DICT)
-    if len(list(qcoll)) > 0:
-        if sort_on == 'modified':
-            coll_names = [result['COLL_NAME'] for result in list(qcoll)]
-        else:
-            if sort_order == 'desc':
-                coll_names = [result['ORDER_DESC(COLL_NAME)'] for result in list(qcoll)]
-            else:
-                coll_names = [result['ORDER(COLL_NAME)'] for result in list(qcoll)]
-        qcoll_title  = Query(ctx, ccols, "META_DATA_ATTR_NAME = 'title' and COLL_NAME = '" + "' || = '".join(coll_names) + "'", offset=offset, limit=limit, output=AS_DICT)
-        qcoll_status = Query(ctx, ccols, "META_DATA_ATTR_NAME = 'status' and COLL_NAME = '" + "' || = '".join(coll_names) + "'", offset=offset, limit=limit, output=AS_DICT)
-    else:
+
+    # Count results first, so that empty listings need no further queries
+    total = qcoll.total_rows()
+    if total == 0:
         return OrderedDict([('total', 0), ('items', [])])
 
-    # Execute query
-    colls = map(transform, list(qcoll))
-    #
-    # Merge datarequest title into results
-    colls_title = map(transform_title, list(qcoll_title))
-    for datarequest_title in colls_title:
-        for datarequest in colls:
-            if datarequest_title['id'] == datarequest['id']:
-                datarequest['title'] = datarequest_title['title']
-                break
-    #
-    # Merge datarequest status into results
-    colls_status = map(transform_status, list(qcoll_status))
-    for datarequest_status in colls_status:
-        for datarequest in colls:
-            if datarequest_status['id'] == datarequest['id']:
-                datarequest['status'] = datarequest_status['status']
-                break
+    # Execute query (once; every iteration over a Query object executes it again)
+    rows = list(qcoll)
+    if sort_on == 'modified':
+        coll_names = [result['COLL_NAME'] for result in rows]
+    else:
+        if sort_order == 'desc':
+            coll_names = [result['ORDER_DESC(COLL_NAME)'] for result in rows]
+        else:
+            coll_names = [result['ORDER(COLL_NAME)'] for result in rows]
 
-    if len(colls) == 0:
-        # No results at all?
-        # Make sure the collection actually exists
-        if not collection.exists(ctx, coll):
-            return api.Error('nonexistent', 'The given path does not exist')
-        # (checking this beforehand would waste a query in the most common situation)
+    colls = map(transform, rows)
+    colls_by_id = {}
+    for datarequest in colls:
+        colls_by_id.setdefault(datarequest['id'], datarequest)
+    #
+    # Merge datarequest title and status into results (retrieved for all data requests on the page
+    # in a single query, or a few if the page is too large for one query condition)
+    for i in range(0, len(coll_names), GENQUERY_IN_CHUNK_SIZE):
+        qcoll_meta = Query(ctx, ['COLL_NAME', 'META_DATA_ATTR_NAME', 'META_DATA_ATTR_VALUE'],
+                           "DATA_NAME = '{}' AND META_DATA_ATTR_NAME in ('title', 'status') AND COLL_NAME in ('{}')".format(
+                               DATAREQUEST + JSON_EXT, "', '".join(coll_names[i:i + GENQUERY_IN_CHUNK_SIZE])),
+                           output=AS_DICT)
+        for row in qcoll_meta:
+            datarequest = colls_by_id.get(row['COLL_NAME'].split('/')[-1])
+            if datarequest is not None:
+                datarequest[row['META_DATA_ATTR_NAME']] = row['META_DATA_ATTR_VALUE']
 
-    return OrderedDict([('total', qcoll.total_rows()), ('items', colls)])
+    return OrderedDict([('total', total), ('items', colls)])
 
 
 def datarequest_process_expired_review_periods(ctx, request_ids):
@@ -897,12 +1340,12 @@ def file_write_and_lock(ctx, coll_path, filename, data, readers):
         msi.set_acl(ctx, "default", "read", reader, file_path)
 
     # Revoke temporary write permission (unless read permissions were set on the invoking user)
-    if not user.full_name(ctx) in readers:
-        msi.set_acl(ctx, "default", "null", user.full_name(ctx), file_path)
+    if not _user_full_name(ctx) in readers:
+        msi.set_acl(ctx, "default", "null", _user_full_name(ctx), file_path)
     # If invoking user is request owner, set read permission for this user on the collection again,
     # else revoke individual user permissions on collection entirely (invoking users will still have
     # appropriate permissions through group membership, e.g. the project managers group)
-    permission = "read" if user.name(ctx) == datarequest_owner_get(ctx, coll_path.split('/')[-1]) \
+    permission = "read" if _user_name(ctx) == datarequest_owner_get(ctx, coll_path.split('/')[-1]) \
                  else "revoke"
     ctx.adminTempWritePermission(coll_path, permission)
 
@@ -918,8 +1361,13 @@ def api_datarequest_submit(ctx, data, draft, draft_request_id=None):
 
     :returns: API status
     """
+    # Permission check
+    groups = _user_groups_get(ctx)
+    if GROUP_PM in groups or GROUP_DM in groups:
+        return api.Error("permission_error", "Action not permitted.")
+
     # Set request owner in form data
-    data['owner'] = user.name(ctx)
+    data['owner'] = _user_name(ctx)
 
     # Set draft flag in form data
     data['draft'] = draft
@@ -931,17 +1379,13 @@ def api_datarequest_submit(ctx, data, draft, draft_request_id=None):
     ])]
 
     # Set submission date in form data
-    data['submission_timestamp'] = str(datetime.now().strftime('%s'))
+    data['submission_timestamp'] = str(int(time.time()))
 
     # Validate data against schema
     if not draft and not datarequest_data_valid(ctx, data, DATAREQUEST):
         return api.Error("validation_fail",
                          "{} form data did not pass validation against its schema.".format(DATAREQUEST))
 
-    # Permission check
-    if (user.is_member_of(ctx, GROUP_PM) or user.is_member_of(ctx, GROUP_DM)):
-        return api.Error("permission_error", "Action not permitted.")
-
     # If we're not working with a draft, generate a new request ID.
     if draft_request_id:
         request_id = draft_request_id
@@ -950,7 +1394,7 @@ def api_datarequest_submit(ctx, data, draft, draft_request_id=None):
         request_id = generate_request_id(ctx)
 
     # Construct data request collection and file path.
-    coll_path = "/{}/{}/{}".format(user.zone(ctx), DRCOLLECTION, request_id)
+    coll_path = _dr_coll_path(ctx, request_id)
     file_path = "{}/{}".format(coll_path, DATAREQUEST + JSON_EXT)
 
     # If we're not working with a draft, initialize the data request collection
@@ -969,43 +1413,33 @@ def api_datarequest_submit(ctx, data, draft, draft_request_id=None):
             return api.Error("create_collection_fail", "Could not create collection path: {}.".format(e))
 
         # Grant permissions on collections
-        msi.set_acl(ctx, "default", "read", GROUP_DM, coll_path)
-        msi.set_acl(ctx, "default", "read", GROUP_DAC, coll_path)
-        msi.set_acl(ctx, "default", "read", GROUP_PM, coll_path)
-        msi.set_acl(ctx, "default", "own", "rods", coll_path)
-        msi.set_acl(ctx, "default", "read", GROUP_DM, attachments_path)
-        msi.set_acl(ctx, "default", "read", GROUP_DAC, attachments_path)
-        msi.set_acl(ctx, "default", "read", GROUP_PM, attachments_path)
-        msi.set_acl(ctx, "default", "own", "rods", attachments_path)
-        msi.set_acl(ctx, "default", "read", user.full_name(ctx), attachments_path)
-        msi.set_acl(ctx, "default", "read", GROUP_PM, dta_path)
-        msi.set_acl(ctx, "default", "read", GROUP_DM, dta_path)
-        msi.set_acl(ctx, "default", "read", user.full_name(ctx), dta_path)
-        msi.set_acl(ctx, "default", "own", "rods", dta_path)
-        msi.set_acl(ctx, "default", "read", GROUP_PM, sigdta_path)
-        msi.set_acl(ctx, "default", "read", GROUP_DM, sigdta_path)
-        msi.set_acl(ctx, "default", "read", user.full_name(ctx), sigdta_path)
-        msi.set_acl(ctx, "default", "own", "rods", sigdta_path)
+        researcher = _user_full_name(ctx)
+        for path, subcollection_acls in [(coll_path,        INITIAL_ACLS),
+                                         (attachments_path, INITIAL_ACLS + [("read", None)]),
+                                         (dta_path,         INITIAL_DTA_ACLS),
+                                         (sigdta_path,      INITIAL_DTA_ACLS)]:
+            for access_level, acl_user in subcollection_acls:
+                msi.set_acl(ctx, "default", access_level, acl_user or researcher, path)
 
         # Create provenance log
         provenance_path = "{}/{}".format(coll_path, PROVENANCE + JSON_EXT)
         jsonutil.write(ctx, provenance_path, {})
 
-        # Write data request
-        jsonutil.write(ctx, file_path, data)
-
         # Apply initial permission restrictions to researcher
-        msi.set_acl(ctx, "default", "null", user.full_name(ctx), provenance_path)
+        msi.set_acl(ctx, "default", "null", _user_full_name(ctx), provenance_path)
         msi.set_acl(ctx, "default", "read", "public", coll_path)
 
-    # Write form data to disk
+    # Write form data to disk (the serialized form data is also used to set the AVUs below)
+    payload = jsonutil.dump(data)
     try:
-        jsonutil.write(ctx, file_path, data)
+        data_object.write(ctx, file_path, payload)
     except error.UUError:
         return api.Error('write_error', 'Could not write datarequest to disk.')
+    _ctx_cache(ctx).pop(('datarequest', str(request_id)), None)
+    _ctx_cache(ctx).pop(('json', 'datarequest_get', str(request_id)), None)
 
     # Set the proposal fields as AVUs on the proposal JSON file
-    avu_json.set_json_to_obj(ctx, file_path, "-d", "root", json.dumps(data))
+    avu_json.set_json_to_obj(ctx, file_path, "-d", "root", payload)
 
     # If draft, set status
     if draft:
@@ -1022,23 +1456,27 @@ def api_datarequest_submit(ctx, data, draft, draft_request_id=None):
     msi.set_acl(ctx, "default", "read", GROUP_PM, file_path)
 
     # Revoke write permission
-    msi.set_acl(ctx, "default", "read", user.full_name(ctx), file_path)
+    msi.set_acl(ctx, "default", "read", _user_full_name(ctx), file_path)
 
     # If submission is a resubmission of a previously rejected data request, set status of previous
-    # request to RESUBMITTED
+    # request to RESUBMITTED (the status changes of both requests are processed in one go)
+    status_changes = []
     if 'previous_request_id' in data:
-        status_set(ctx, data['previous_request_id'], status.RESUBMITTED)
+        status_changes.append((data['previous_request_id'], DATAREQUESTSTATUSATTRNAME,
+                               status.RESUBMITTED.value))
 
     # Update data request status
     if data['datarequest']['purpose'] == "Analyses for data assessment only (results will not be published)":
-        status_set(ctx, request_id, status.DAO_SUBMITTED)
+        new_status = status.DAO_SUBMITTED
+    elif data['datarequest']['attachments']['attachments'] == "Yes":
+        new_status = status.PENDING_ATTACHMENTS
     else:
-        if data['datarequest']['attachments']['attachments'] == "Yes":
-            status_set(ctx, request_id, status.PENDING_ATTACHMENTS)
-            return {"pendingAttachments": True, "requestId": request_id}
-        else:
-            status_set(ctx, request_id, status.SUBMITTED)
-            return
+        new_status = status.SUBMITTED
+    status_changes.append((request_id, DATAREQUESTSTATUSATTRNAME, new_status.value))
+    metadata_set_many(ctx, status_changes)
+
+    if new_status == status.PENDING_ATTACHMENTS:
+        return {"pendingAttachments": True, "requestId": request_id}
 
 
 @api.make()
@@ -1059,22 +1497,24 @@ def api_datarequest_get(ctx, request_id):
     # Get request type
     datarequest_type = type_get(ctx, request_id).value
 
-    # Get request status
-    datarequest_status = status_get(ctx, request_id).value
+    # Get request status (all AVUs, including the reviewers needed for the available documents,
+    # are retrieved at once)
+    avus               = datarequest_avus_get(ctx, request_id)
+    datarequest_status = status_get(ctx, request_id, avus).value
 
     # Get list of available documents
     datarequest_available_documents = available_documents_get(ctx, request_id, datarequest_type, datarequest_status)
 
     # Get request
     datarequest_json = datarequest_get(ctx, request_id)
-    datarequest = json.loads(datarequest_json)
+    datarequest = _json_get(ctx, datarequest_get, request_id)
 
     # Get request schema version
     if 'links' not in datarequest:  # Schema version youth-0 doesn't link to its schema ID
         datarequest_schema_version = "youth-0"
     else:
         datarequest_links = [link for link in datarequest['links'] if link['rel'] == 'describedby']
-        datarequest_schema_version_links_count = len(list(datarequest_links))
+        datarequest_schema_version_links_count = len(datarequest_links)
         # Fail if not exactly one schema ID link is present
         if datarequest_schema_version_links_count == 0:
             return api.Error("datarequest_parse_fail", "This datarequest does not link to its schema ID.")
@@ -1082,7 +1522,7 @@ def api_datarequest_get(ctx, request_id):
             return api.Error("datarequest_parse_fail", "This datarequest contains more than one schema ID link.")
         else:
             datarequest_schema_id = datarequest_links[0]['href']
-            datarequest_schema_version = re.search(r'https://yoda.uu.nl/datarequest/schemas/(.*)/datarequest/schema.json', datarequest_schema_id).group(1)
+            datarequest_schema_version = SCHEMA_ID_PATTERN.search(datarequest_schema_id).group(1)
 
     # Return JSON encoded results
     return {'requestSchemaVersion': datarequest_schema_version, 'requestJSON': datarequest_json, 'requestType': datarequest_type,
@@ -1097,20 +1537,25 @@ def datarequest_get(ctx, request_id):
 
     :returns: Datarequest JSON or API error on failure
     """
-    # Force conversion of request_id to string
-    request_id = str(request_id)
+    # Contents are memoized for the duration of the rule invocation
+    cache = _ctx_cache(ctx)
+    key = ('datarequest', str(request_id))
+    if key in cache:
+        return cache[key]
 
     # Construct filename and filepath
-    coll_path = "/{}/{}/{}".format(user.zone(ctx), DRCOLLECTION, request_id)
+    coll_path = _dr_coll_path(ctx, request_id)
     file_name = DATAREQUEST + JSON_EXT
     file_path = "{}/{}".format(coll_path, file_name)
 
     # Get the contents of the datarequest JSON file
     try:
-        return data_object.read(ctx, file_path)
+        cache[key] = data_object.read(ctx, file_path)
     except error.UUError as e:
         return api.Error("datarequest_read_fail", "Could not get contents of datarequest JSON file: {}.".format(e))
 
+    return cache[key]
+
 
 @api.make()
 def api_datarequest_attachment_upload_permission(ctx, request_id, action):
@@ -1133,8 +1578,7 @@ def api_datarequest_attachment_upload_permission(ctx, request_id, action):
         return api.Error("InputError", "Invalid action input parameter.")
 
     # Grant/revoke temporary write permissions
-    attachments_path = "/{}/{}/{}/{}".format(user.zone(ctx), DRCOLLECTION, request_id,
-                                             ATTACHMENTS_PATHNAME)
+    attachments_path = _dr_coll_path(ctx, request_id, ATTACHMENTS_PATHNAME)
     ctx.adminTempWritePermission(attachments_path, action)
     return
 
@@ -1154,8 +1598,7 @@ def api_datarequest_attachment_post_upload_actions(ctx, request_id, filename):
     datarequest_action_permitted(ctx, request_id, ["OWN"], [status.PENDING_ATTACHMENTS])
 
     # Set permissions
-    file_path = "/{}/{}/{}/{}/{}".format(user.zone(ctx), DRCOLLECTION, request_id,
-                                         ATTACHMENTS_PATHNAME, filename)
+    file_path = _dr_coll_path(ctx, request_id, ATTACHMENTS_PATHNAME, filename)
     msi.set_acl(ctx, "default", "read", GROUP_DM, file_path)
     msi.set_acl(ctx, "default", "read", GROUP_PM, file_path)
 
@@ -1169,6 +1612,9 @@ def api_datarequest_attachments_get(ctx, request_id):
 
     :returns:          List of attachment filenames
     """
+    # Force conversion of request_id to string
+    request_id = str(request_id)
+
     return datarequest_attachments_get(ctx, request_id)
 
 
@@ -1180,19 +1626,12 @@ def datarequest_attachments_get(ctx, request_id):
 
     :returns:          List of attachment filenames
     """
-    def get_filename(file_path):
-        return file_path.split('/')[-1]
-
-    # Force conversion of request_id to string
-    request_id = str(request_id)
-
     # Permission check
     datarequest_action_permitted(ctx, request_id, ["PM", "DM", "DAC", "OWN"], None)
 
-    # Return list of attachment filepaths
-    coll_path = "/{}/{}/{}/{}".format(user.zone(ctx), DRCOLLECTION, request_id,
-                                      ATTACHMENTS_PATHNAME)
-    return map(get_filename, list(collection.data_objects(ctx, coll_path)))
+    # Return list of attachment filenames
+    coll_path = _dr_coll_path(ctx, request_id, ATTACHMENTS_PATHNAME)
+    return [row[0] for row in row_iterator("DATA_NAME", "COLL_NAME = '{}'".format(coll_path), AS_LIST, ctx)]
 
 
 @api.make()
@@ -1209,9 +1648,10 @@ def api_datarequest_attachments_submit(ctx, request_id):
     datarequest_action_permitted(ctx, request_id, ["OWN"], [status.PENDING_ATTACHMENTS])
 
     # Revoke ownership and write access
-    coll_path = "/{}/{}/{}/{}".format(user.zone(ctx), DRCOLLECTION, request_id, ATTACHMENTS_PATHNAME)
-    for attachment_path in list(collection.data_objects(ctx, coll_path)):
-        msi.set_acl(ctx, "default", "read", datarequest_owner_get(ctx, request_id), attachment_path)
+    coll_path = _dr_coll_path(ctx, request_id, ATTACHMENTS_PATHNAME)
+    owner     = datarequest_owner_get(ctx, request_id)
+    for attachment_path in collection.data_objects(ctx, coll_path):
+        msi.set_acl(ctx, "default", "read", owner, attachment_path)
 
     # Set status to dta_ready
     status_set(ctx, request_id, status.SUBMITTED)
@@ -1239,7 +1679,7 @@ def api_datarequest_preliminary_review_submit(ctx, data, request_id):
     datarequest_action_permitted(ctx, request_id, ["PM"], [status.SUBMITTED])
 
     # Construct path to collection
-    coll_path = "/{}/{}/{}".format(user.zone(ctx), DRCOLLECTION, request_id)
+    coll_path = _dr_coll_path(ctx, request_id)
 
     # Write form data to disk
     try:
@@ -1248,19 +1688,15 @@ def api_datarequest_preliminary_review_submit(ctx, data, request_id):
         return api.Error('write_error', 'Could not write preliminary review data to disk: {}'.format(e))
 
     # Get decision
-    decision = data['preliminary_review']
+    decision = PR_REVIEW_DECISIONS.get(data['preliminary_review'])
+    if decision is None:
+        return api.Error("InvalidData", "Invalid value for preliminary_review in preliminary review JSON data.")
+    new_status, with_feedback = decision
 
     # Update data request status
-    if decision == "Accepted for data manager review":
-        status_set(ctx, request_id, status.PRELIMINARY_ACCEPT)
-    elif decision == "Rejected":
-        datarequest_feedback_write(ctx, request_id, data['feedback_for_researcher'])
-        status_set(ctx, request_id, status.PRELIMINARY_REJECT)
-    elif decision == "Rejected (resubmit)":
+    if with_feedback:
         datarequest_feedback_write(ctx, request_id, data['feedback_for_researcher'])
-        status_set(ctx, request_id, status.PRELIMINARY_RESUBMIT)
-    else:
-        return api.Error("InvalidData", "Invalid value for preliminary_review in preliminary review JSON data.")
+    status_set(ctx, request_id, new_status)
 
 
 @api.make()
@@ -1289,11 +1725,8 @@ def datarequest_preliminary_review_get(ctx, request_id):
 
     :returns: Preliminary review JSON or API error on failure
     """
-    # Force conversion of request_id to string
-    request_id = str(request_id)
-
     # Construct filename
-    coll_path = "/{}/{}/{}".format(user.zone(ctx), DRCOLLECTION, request_id)
+    coll_path = _dr_coll_path(ctx, request_id)
     file_name = PR_REVIEW + JSON_EXT
     file_path = "{}/{}".format(coll_path, file_name)
 
@@ -1326,10 +1759,10 @@ def api_datarequest_datamanager_review_submit(ctx, data, request_id):
     datarequest_action_permitted(ctx, request_id, ["DM"], [status.PRELIMINARY_ACCEPT])
 
     # Construct path to collection
-    coll_path = "/{}/{}/{}".format(user.zone(ctx), DRCOLLECTION, request_id)
+    coll_path = _dr_coll_path(ctx, request_id)
 
     # Add reviewing data manager to reviewing_dm field of data
-    data['reviewing_dm'] = user.name(ctx)
+    data['reviewing_dm'] = _user_name(ctx)
 
     # Write form data to disk
     try:
@@ -1338,17 +1771,13 @@ def api_datarequest_datamanager_review_submit(ctx, data, request_id):
         return api.Error('write_error', 'Could not write data manager review data to disk')
 
     # Get decision
-    decision = data['datamanager_review']
+    decision = DM_REVIEW_DECISIONS.get(data['datamanager_review'])
+    if decision is None:
+        return api.Error("InvalidData", "Invalid value for decision in data manager review JSON data.")
+    new_status, _ = decision
 
     # Update data request status
-    if decision == "Accepted":
-        status_set(ctx, request_id, status.DATAMANAGER_ACCEPT)
-    elif decision == "Rejected":
-        status_set(ctx, request_id, status.DATAMANAGER_REJECT)
-    elif decision == "Rejected (resubmit)":
-        status_set(ctx, request_id, status.DATAMANAGER_RESUBMIT)
-    else:
-        return api.Error("InvalidData", "Invalid value for decision in data manager review JSON data.")
+    status_set(ctx, request_id, new_status)
 
 
 @api.make()
@@ -1378,11 +1807,8 @@ def datarequest_datamanager_review_get(ctx, request_id):
 
     :returns: Datamanager review JSON or API error on failure
     """
-    # Force conversion of request_id to string
-    request_id = str(request_id)
-
     # Construct filename
-    coll_path = "/{}/{}/{}".format(user.zone(ctx), DRCOLLECTION, request_id)
+    coll_path = _dr_coll_path(ctx, request_id)
     file_name = DM_REVIEW + JSON_EXT
     file_path = "{}/{}".format(coll_path, file_name)
 
@@ -1406,14 +1832,10 @@ def datarequest_dac_members_get(ctx, request_id):
 
     :returns: List of DAC members
     """
-    dac_members = map(lambda member: member[0], group.members(ctx, GROUP_DAC))
-    request_owner = datarequest_owner_get(ctx, request_id)
-    if request_owner in dac_members:
-        dac_members.remove(request_owner)
-    if "rods" in dac_members:
-        dac_members.remove("rods")
+    # The request owner and rods are never eligible as reviewers
+    excluded = {datarequest_owner_get(ctx, request_id), "rods"}
 
-    return dac_members
+    return [member for member, _ in _group_members_get(ctx, GROUP_DAC) if member not in excluded]
 
 
 @api.make()
@@ -1431,10 +1853,7 @@ def api_datarequest_assignment_submit(ctx, data, request_id):
 
     # Validate data against schema
     dac_members = datarequest_dac_members_get(ctx, request_id)
-    schema      = datarequest_schema_get(ctx, ASSIGNMENT)
-    schema['schema']['dependencies']['decision']['oneOf'][0]['properties']['assign_to']['items']['enum']      = dac_members
-    schema['schema']['dependencies']['decision']['oneOf'][0]['properties']['assign_to']['items']['enumNames'] = dac_members
-    if not datarequest_data_valid(ctx, data, schema=schema):
+    if not _validator_get_assignment(ctx, dac_members).is_valid(data):
         return api.Error("validation_fail",
                          "{} form data did not pass validation against its schema.".format(ASSIGNMENT))
 
@@ -1444,7 +1863,7 @@ def api_datarequest_assignment_submit(ctx, data, request_id):
                                                            status.DATAMANAGER_RESUBMIT])
 
     # Construct path to collection
-    coll_path = "/{}/{}/{}".format(user.zone(ctx), DRCOLLECTION, request_id)
+    coll_path = _dr_coll_path(ctx, request_id)
 
     # Set date of end of review period as metadata on the datarequest (if
     # accepted for review)
@@ -1458,8 +1877,8 @@ def api_datarequest_assignment_submit(ctx, data, request_id):
     try:
         # Determine who is permitted to read
         permitted_to_read = [GROUP_DM, GROUP_PM]
-        if 'assign_to' in data.keys():
-            permitted_to_read = permitted_to_read + data['assign_to'][:]
+        if 'assign_to' in data:
+            permitted_to_read = permitted_to_read + data['assign_to']
 
         # Write form data to disk
         file_write_and_lock(ctx, coll_path, ASSIGNMENT + JSON_EXT, data, permitted_to_read)
@@ -1467,40 +1886,60 @@ def api_datarequest_assignment_submit(ctx, data, request_id):
         return api.Error('write_error', 'Could not write assignment data to disk')
 
     # Get decision
-    decision = data['decision']
+    decision = ASSIGNMENT_DECISIONS.get(data['decision'])
+    if decision is None:
+        return api.Error("InvalidData", "Invalid value for 'decision' key in datamanager review review JSON data.")
+    new_status, with_feedback = decision
 
     # Update data request status
-    if decision == "Accepted for review":
-        assignees = json.dumps(data['assign_to'])
-        assign_request(ctx, assignees, request_id)
-        status_set(ctx, request_id, status.UNDER_REVIEW)
-    elif decision == "Rejected":
+    if new_status == status.UNDER_REVIEW:
+        assign_request(ctx, data['assign_to'], request_id)
+    if with_feedback:
         datarequest_feedback_write(ctx, request_id, data['feedback_for_researcher'])
-        status_set(ctx, request_id, status.REJECTED_AFTER_DATAMANAGER_REVIEW)
-    elif decision == "Rejected (resubmit)":
-        datarequest_feedback_write(ctx, request_id, data['feedback_for_researcher'])
-        status_set(ctx, request_id, status.RESUBMIT_AFTER_DATAMANAGER_REVIEW)
-    else:
-        return api.Error("InvalidData", "Invalid value for 'decision' key in datamanager review review JSON data.")
+    status_set(ctx, request_id, new_status)
+
+
+def _grant_read_batched(ctx, coll_path, data_names, user):
+    """Grant a user read access to data objects of a collection, in as few admin invocations as possible.
+
+    :param ctx:        Combined type of a callback and rei struct
+    :param coll_path:  Collection containing the data objects
+    :param data_names: Names of the data objects
+    :param user:       User to grant read access to
+    """
+    # Data object names cannot contain "/", so it is safe to use as separator
+    batch = []
+    for data_name in data_names:
+        if batch and len("/".join(batch + [data_name])) > PERMISSION_BATCH_MAX_LENGTH:
+            ctx.adminTempWritePermissionBatch(coll_path, "grantread", "/".join(batch), user)
+            batch = []
+        batch.append(data_name)
+
+    if batch:
+        ctx.adminTempWritePermissionBatch(coll_path, "grantread", "/".join(batch), user)
 
 
 def assign_request(ctx, assignees, request_id):
     """Assign a data request to one or more DAC members for review.
 
     :param ctx:        Combined type of a callback and rei struct
-    :param assignees:  JSON-formatted array of DAC members
+    :param assignees:  List of DAC members
     :param request_id: Unique identifier of the data request
     """
     # Construct data request collection path
-    coll_path = "/{}/{}/{}".format(user.zone(ctx), DRCOLLECTION, request_id)
-
-    # Grant read permissions on relevant files of data request
-    attachments = datarequest_attachments_get(ctx, request_id)
-    attachments = map(lambda attachment: ATTACHMENTS_PATHNAME + "/" + attachment, attachments)
-    for assignee in json.loads(assignees):
-        for doc in map(lambda filename: filename + JSON_EXT, [DATAREQUEST, PR_REVIEW, DM_REVIEW]) + attachments:
-            file_path = "{}/{}".format(coll_path, doc)
-            ctx.adminTempWritePermission(file_path, "grantread", "{}#{}".format(assignee, user.zone(ctx)))
+    coll_path = _dr_coll_path(ctx, request_id)
+    zone      = _zone(ctx)
+
+    # Grant read permissions on relevant files of data request, with batched
+    # admin invocations per assignee (one for the data request collection and
+    # one for its attachments, unless there are too many to pass at once)
+    docs             = [filename + JSON_EXT for filename in [DATAREQUEST, PR_REVIEW, DM_REVIEW]]
+    attachments_path = _dr_coll_path(ctx, request_id, ATTACHMENTS_PATHNAME)
+    attachments      = datarequest_attachments_get(ctx, request_id)
+    for assignee in assignees:
+        user = "{}#{}".format(assignee, zone)
+        _grant_read_batched(ctx, coll_path, docs, user)
+        _grant_read_batched(ctx, attachments_path, attachments, user)
 
     # Assign the data request by adding a delayed rule that sets one or more
     # "assignedForReview" attributes on the datarequest (the number of
@@ -1509,9 +1948,10 @@ def assign_request(ctx, assignees, request_id):
     status_info = ""
     ctx.requestDatarequestMetadataChange(coll_path,
                                          "assignedForReview",
-                                         assignees,
-                                         str(len(json.loads(assignees))),
+                                         json.dumps(assignees),
+                                         str(len(assignees)),
                                          status, status_info)
+    _metadata_cache_clear(ctx, request_id)
 
     # ... and triggering the processing of delayed rules
     ctx.adminDatarequestActions()
@@ -1543,11 +1983,8 @@ def datarequest_assignment_get(ctx, request_id):
 
     :returns: Assignment JSON or API error on failure
     """
-    # Force conversion of request_id to string
-    request_id = str(request_id)
-
     # Construct filename
-    coll_path = "/{}/{}/{}".format(user.zone(ctx), DRCOLLECTION, request_id)
+    coll_path = _dr_coll_path(ctx, request_id)
     file_name = ASSIGNMENT + JSON_EXT
     file_path = "{}/{}".format(coll_path, file_name)
 
@@ -1580,31 +2017,22 @@ def api_datarequest_review_submit(ctx, data, request_id):
     datarequest_action_permitted(ctx, request_id, ["PM"], [status.UNDER_REVIEW])
 
     # Construct path to collection
-    coll_path = "/{}/{}/{}".format(user.zone(ctx), DRCOLLECTION, request_id)
+    coll_path = _dr_coll_path(ctx, request_id)
+    me        = _user_name(ctx)
 
     # Write form data to disk
     try:
-        readers = [GROUP_PM] + map(lambda reviewer: reviewer + "#" + user.zone(ctx),
-                                   datarequest_reviewers_get(ctx, request_id))
-        file_write_and_lock(ctx, coll_path, REVIEW + "_{}".format(user.name(ctx)) + JSON_EXT, data, readers)
+        zone    = _zone(ctx)
+        readers = [GROUP_PM] + [reviewer + "#" + zone for reviewer in datarequest_reviewers_get(ctx, request_id)]
+        file_write_and_lock(ctx, coll_path, REVIEW + "_{}".format(me) + JSON_EXT, data, readers)
     except error.UUError as e:
         return api.Error('write_error', 'Could not write review data to disk: {}.'.format(e))
 
-    # Remove the assignedForReview attribute of this user by first fetching
-    # the list of reviewers ...
-    reviewers = []
-
-    iter = row_iterator(
-        "META_DATA_ATTR_VALUE",
-        "COLL_NAME = '{}' AND DATA_NAME = '{}' AND META_DATA_ATTR_NAME = 'assignedForReview'".format(coll_path, DATAREQUEST + JSON_EXT),
-        AS_LIST, ctx)
-
-    for row in iter:
-        reviewer = row[0]
-        reviewers.append(reviewer)
-
-    # ... then removing the current reviewer from the list
-    reviewers.remove(user.name(ctx))
+    # Remove the assignedForReview attribute of this user by taking the
+    # pending reviewers (already retrieved above) other than the current
+    # reviewer ...
+    reviewers = [reviewer for reviewer in datarequest_reviewers_get(ctx, request_id, pending=True)
+                 if reviewer != me]
 
     # ... and then updating the assignedForReview attributes
     status_code = ""
@@ -1614,10 +2042,11 @@ def api_datarequest_review_submit(ctx, data, request_id):
                                          json.dumps(reviewers),
                                          str(len(reviewers)),
                                          status_code, status_info)
+    _metadata_cache_clear(ctx, request_id)
     ctx.adminDatarequestActions()
 
     # Set a reviewedBy attribute
-    metadata_set(ctx, request_id, "reviewedBy", user.name(ctx))
+    metadata_set(ctx, request_id, "reviewedBy", me)
 
     # If there are no reviewers left, update data request status
     if len(reviewers) < 1:
@@ -1640,7 +2069,7 @@ def api_datarequest_reviews_get(ctx, request_id):
     datarequest_action_permitted(ctx, request_id, ["PM", "REV"], None)
 
     # Construct filename
-    coll_path = "/{}/{}/{}".format(user.zone(ctx), DRCOLLECTION, request_id)
+    coll_path = _dr_coll_path(ctx, request_id)
     file_name = 'review_%.json'
 
     # Get the review JSON files
@@ -1680,7 +2109,7 @@ def api_datarequest_evaluation_submit(ctx, data, request_id):
     datarequest_action_permitted(ctx, request_id, ["PM"], [status.REVIEWED])
 
     # Construct path to collection
-    coll_path = "/{}/{}/{}".format(user.zone(ctx), DRCOLLECTION, request_id)
+    coll_path = _dr_coll_path(ctx, request_id)
 
     # Write approval conditions to disk if applicable
     if 'approval_conditions' in data:
@@ -1692,29 +2121,24 @@ def api_datarequest_evaluation_submit(ctx, data, request_id):
 
     # Write form data to disk
     try:
-        readers = [GROUP_PM] + map(lambda reviewer: reviewer + "#" + user.zone(ctx),
-                                   datarequest_reviewers_get(ctx, request_id))
+        zone    = _zone(ctx)
+        readers = [GROUP_PM] + [reviewer + "#" + zone for reviewer in datarequest_reviewers_get(ctx, request_id)]
         file_write_and_lock(ctx, coll_path, EVALUATION + JSON_EXT, data, readers)
     except error.UUError:
         return api.Error('write_error', 'Could not write evaluation data to disk')
 
     # Get decision
-    decision = data['evaluation']
+    decision = EVALUATION_DECISIONS.get(data['evaluation'])
+    if decision is None:
+        return api.Error("InvalidData", "Invalid value for 'evaluation' key in evaluation JSON data.")
+    new_status, with_feedback = decision
 
-    # Update data request status
-    if decision == "Approved":
-        if status_get(ctx, request_id) == status.DAO_SUBMITTED:
-            status_set(ctx, request_id, status.DAO_APPROVED)
-        else:
-            status_set(ctx, request_id, status.APPROVED)
-    elif decision == "Rejected":
-        datarequest_feedback_write(ctx, request_id, data['feedback_for_researcher'])
-        status_set(ctx, request_id, status.REJECTED)
-    elif decision == "Rejected (resubmit)":
+    # Update data request status (approving a DAO request moves it to DAO_APPROVED)
+    if new_status == status.APPROVED and status_get(ctx, request_id) == status.DAO_SUBMITTED:
+        new_status = status.DAO_APPROVED
+    if with_feedback:
         datarequest_feedback_write(ctx, request_id, data['feedback_for_researcher'])
-        status_set(ctx, request_id, status.RESUBMIT)
-    else:
-        return api.Error("InvalidData", "Invalid value for 'evaluation' key in evaluation JSON data.")
+    status_set(ctx, request_id, new_status)
 
 
 @api.make()
@@ -1733,7 +2157,7 @@ def api_datarequest_approval_conditions_get(ctx, request_id):
     datarequest_action_permitted(ctx, request_id, ["OWN"], None)
 
     # Construct filename
-    coll_path = "/{}/{}/{}".format(user.zone(ctx), DRCOLLECTION, request_id)
+    coll_path = _dr_coll_path(ctx, request_id)
     file_name = APPROVAL_CONDITIONS + JSON_EXT
     file_path = "{}/{}".format(coll_path, file_name)
 
@@ -1775,11 +2199,8 @@ def datarequest_evaluation_get(ctx, request_id):
 
     :returns: Evaluation JSON or API error on failure
     """
-    # Force conversion of request_id to string
-    request_id = str(request_id)
-
     # Construct filename
-    coll_path = "/{}/{}/{}".format(user.zone(ctx), DRCOLLECTION, request_id)
+    coll_path = _dr_coll_path(ctx, request_id)
     file_name = EVALUATION + JSON_EXT
     file_path = "{}/{}".format(coll_path, file_name)
 
@@ -1799,11 +2220,8 @@ def datarequest_feedback_write(ctx, request_id, feedback):
 
     :returns:          API status
     """
-    # Force conversion of request_id to string
-    request_id = str(request_id)
-
     # Construct path to feedback file
-    coll_path = "/{}/{}/{}".format(user.zone(ctx), DRCOLLECTION, request_id)
+    coll_path = _dr_coll_path(ctx, request_id)
 
     # Write form data to disk
     try:
@@ -1839,7 +2257,7 @@ def api_datarequest_feedback_get(ctx, request_id):
                                   status.RESUBMIT])
 
     # Construct filename
-    coll_path = "/{}/{}/{}".format(user.zone(ctx), DRCOLLECTION, request_id)
+    coll_path = _dr_coll_path(ctx, request_id)
     file_path = "{}/{}".format(coll_path, FEEDBACK + JSON_EXT)
 
     # Get the contents of the feedback JSON file
@@ -1871,11 +2289,11 @@ def api_datarequest_preregistration_submit(ctx, data, request_id):
     datarequest_action_permitted(ctx, request_id, ["OWN"], [status.APPROVED])
 
     # Construct path to collection
-    coll_path = "/{}/{}/{}".format(user.zone(ctx), DRCOLLECTION, request_id)
+    coll_path = _dr_coll_path(ctx, request_id)
 
     # Write form data to disk
     try:
-        file_write_and_lock(ctx, coll_path, PREREGISTRATION + JSON_EXT, data, [user.full_name(ctx), GROUP_PM])
+        file_write_and_lock(ctx, coll_path, PREREGISTRATION + JSON_EXT, data, [_user_full_name(ctx), GROUP_PM])
     except error.UUError:
         return api.Error('write_error', 'Could not write preregistration data to disk')
 
@@ -1909,11 +2327,8 @@ def datarequest_preregistration_get(ctx, request_id):
 
     :returns: Preregistration JSON or API error on failure
     """
-    # Force conversion of request_id to string
-    request_id = str(request_id)
-
     # Construct filename
-    coll_path = "/{}/{}/{}".format(user.zone(ctx), DRCOLLECTION, request_id)
+    coll_path = _dr_coll_path(ctx, request_id)
     file_name = PREREGISTRATION + JSON_EXT
     file_path = "{}/{}".format(coll_path, file_name)
 
@@ -1962,7 +2377,7 @@ def api_datarequest_dta_upload_permission(ctx, request_id, action):
         return api.Error("InputError", "Invalid action input parameter.")
 
     # Grant/revoke temporary write permissions
-    dta_coll_path = "/{}/{}/{}/{}".format(user.zone(ctx), DRCOLLECTION, request_id, DTA_PATHNAME)
+    dta_coll_path = _dr_coll_path(ctx, request_id, DTA_PATHNAME)
     ctx.adminTempWritePermission(dta_coll_path, action)
 
 
@@ -1982,8 +2397,7 @@ def api_datarequest_dta_post_upload_actions(ctx, request_id, filename):
                                                            status.DAO_APPROVED])
 
     # Set permissions
-    file_path = "/{}/{}/{}/{}/{}".format(user.zone(ctx), DRCOLLECTION, request_id, DTA_PATHNAME,
-                                         filename)
+    file_path = _dr_coll_path(ctx, request_id, DTA_PATHNAME, filename)
     msi.set_acl(ctx, "default", "read", GROUP_DM, file_path)
     msi.set_acl(ctx, "default", "read", GROUP_PM, file_path)
     msi.set_acl(ctx, "default", "read", datarequest_owner_get(ctx, request_id), file_path)
@@ -1994,9 +2408,30 @@ def api_datarequest_dta_post_upload_actions(ctx, request_id, filename):
 
 @api.make()
 def api_datarequest_dta_path_get(ctx, request_id):
+    # Force conversion of request_id to string
+    request_id = str(request_id)
+
     return datarequest_dta_path_get(ctx, request_id)
 
 
+def _first_data_object_get(ctx, coll_path, description):
+    """Get the path of the first data object in a collection, without listing the whole collection
+
+    :param ctx:         Combined type of a callback and rei struct
+    :param coll_path:   Path of collection
+    :param description: Description of the data object, used in the error message
+
+    :raises api.Error: Collection contains no data objects
+
+    :returns: Path of data object
+    """
+    data_name = Query(ctx, "DATA_NAME", "COLL_NAME = '{}'".format(coll_path), limit=1).first()
+    if data_name is None:
+        raise api.Error("ReadError", "Could not find {}.".format(description))
+
+    return "{}/{}".format(coll_path, data_name)
+
+
 def datarequest_dta_path_get(ctx, request_id):
 
     """Get path to DTA
@@ -2006,14 +2441,10 @@ def datarequest_dta_path_get(ctx, request_id):
 
     :returns:          Path to DTA
     """
-    # Force conversion of request_id to string
-    request_id = str(request_id)
-
     # Permission check
     datarequest_action_permitted(ctx, request_id, ["PM", "DM", "OWN"], None)
 
-    coll_path = "/{}/{}/{}/{}".format(user.zone(ctx), DRCOLLECTION, request_id, DTA_PATHNAME)
-    return list(collection.data_objects(ctx, coll_path))[0]
+    return _first_data_object_get(ctx, _dr_coll_path(ctx, request_id, DTA_PATHNAME), "DTA")
 
 
 @api.make()
@@ -2037,7 +2468,7 @@ def api_datarequest_signed_dta_upload_permission(ctx, request_id, action):
         return api.Error("InputError", "Invalid action input parameter.")
 
     # Grant/revoke temporary write permissions
-    dta_coll_path = "/{}/{}/{}/{}".format(user.zone(ctx), DRCOLLECTION, request_id, SIGDTA_PATHNAME)
+    dta_coll_path = _dr_coll_path(ctx, request_id, SIGDTA_PATHNAME)
     ctx.adminTempWritePermission(dta_coll_path, action)
 
 
@@ -2056,8 +2487,7 @@ def api_datarequest_signed_dta_post_upload_actions(ctx, request_id, filename):
     datarequest_action_permitted(ctx, request_id, ["OWN"], [status.DTA_READY])
 
     # Set permissions
-    file_path = "/{}/{}/{}/{}/{}".format(user.zone(ctx), DRCOLLECTION, request_id, SIGDTA_PATHNAME,
-                                         filename)
+    file_path = _dr_coll_path(ctx, request_id, SIGDTA_PATHNAME, filename)
     msi.set_acl(ctx, "default", "read", GROUP_DM, file_path)
     msi.set_acl(ctx, "default", "read", GROUP_PM, file_path)
     msi.set_acl(ctx, "default", "read", datarequest_owner_get(ctx, request_id), file_path)
@@ -2081,8 +2511,7 @@ def api_datarequest_signed_dta_path_get(ctx, request_id):
     # Permission check
     datarequest_action_permitted(ctx, request_id, ["PM", "DM", "OWN"], None)
 
-    coll_path = "/{}/{}/{}/{}".format(user.zone(ctx), DRCOLLECTION, request_id, SIGDTA_PATHNAME)
-    return list(collection.data_objects(ctx, coll_path))[0]
+    return _first_data_object_get(ctx, _dr_coll_path(ctx, request_id, SIGDTA_PATHNAME), "signed DTA")
 
 
 @api.make()
@@ -2105,79 +2534,38 @@ def api_datarequest_data_ready(ctx, request_id):
 #                   Email logic                   #
 ###################################################
 
-def truncated_title_get(ctx, request_id):
-    datarequest = json.loads(datarequest_get(ctx, request_id))
+def truncated_title_get(datarequest):
     study_title = datarequest['datarequest']['study_information']['title']
 
     return study_title if len(study_title) < 16 else study_title[0:15] + "..."
 
 
 def send_emails(ctx, obj_name, status_to):
+    # The status has just been set to status_to, so there is no need to query it. Return
+    # immediately if the new status does not trigger any emails.
+    datarequest_status = _STATUS_BY_VALUE.get(status_to)
+    send = EMAIL_DISPATCH.get(datarequest_status)
+    if send is None:
+        return
+
     # Get request ID
     temp, _       = pathutil.chop(obj_name)
     _, request_id = pathutil.chop(temp)
 
-    # Get datarequest status
-    datarequest_status = status_get(ctx, request_id)
-
-    # Determine and invoke the appropriate email routine
-    if datarequest_status == status.DAO_SUBMITTED:
-        datarequest_submit_emails(ctx, request_id, dao=True)
-
-    elif datarequest_status == status.SUBMITTED:
-        datarequest_submit_emails(ctx, request_id)
-
-    elif datarequest_status in (status.PRELIMINARY_ACCEPT,
-                                status.PRELIMINARY_REJECT,
-                                status.PRELIMINARY_RESUBMIT):
-        preliminary_review_emails(ctx, request_id, datarequest_status)
-
-    elif datarequest_status in (status.DATAMANAGER_ACCEPT,
-                                status.DATAMANAGER_REJECT,
-                                status.DATAMANAGER_RESUBMIT):
-        datamanager_review_emails(ctx, request_id, datarequest_status)
-
-    elif datarequest_status in (status.UNDER_REVIEW,
-                                status.REJECTED_AFTER_DATAMANAGER_REVIEW,
-                                status.RESUBMIT_AFTER_DATAMANAGER_REVIEW):
-        assignment_emails(ctx, request_id, datarequest_status)
-
-    elif datarequest_status == status.REVIEWED:
-        review_emails(ctx, request_id)
-
-    elif datarequest_status in (status.APPROVED,
-                                status.REJECTED,
-                                status.RESUBMIT):
-        evaluation_emails(ctx, request_id, datarequest_status)
-
-    elif datarequest_status == status.PREREGISTRATION_SUBMITTED:
-        preregistration_submit_emails(ctx, request_id)
-
-    elif datarequest_status == status.PREREGISTRATION_CONFIRMED:
-        datarequest_approved_emails(ctx, request_id)
-
-    elif datarequest_status == status.DAO_APPROVED:
-        datarequest_approved_emails(ctx, request_id, dao=True)
-
-    elif datarequest_status == status.DTA_READY:
-        dta_post_upload_actions_emails(ctx, request_id)
-
-    elif datarequest_status == status.DTA_SIGNED:
-        signed_dta_post_upload_actions_emails(ctx, request_id)
-
-    elif datarequest_status == status.DATA_READY:
-        data_ready_emails(ctx, request_id)
+    # Invoke the appropriate email routine, sending all of its mails over one connection
+    with mail.session(ctx):
+        send(ctx, request_id, datarequest_status)
 
 
 def datarequest_submit_emails(ctx, request_id, dao=False):
     # Get (source data for) email input parameters
-    datarequest      = json.loads(datarequest_get(ctx, request_id))
+    datarequest      = _json_get(ctx, datarequest_get, request_id)
     researcher       = datarequest['contact']['principal_investigator']
     researcher_email = datarequest_owner_get(ctx, request_id)
     cc               = cc_email_addresses_get(datarequest['contact'])
     study_title      = datarequest['datarequest']['study_information']['title']
-    truncated_title  = truncated_title_get(ctx, request_id)
-    pm_members       = group.members(ctx, GROUP_PM)
+    truncated_title  = truncated_title_get(datarequest)
+    pm_emails        = _member_emails(ctx, GROUP_PM)
     timestamp        = datetime.fromtimestamp(int(datarequest['submission_timestamp']))
     resubmission     = "previous_request_id" in datarequest
 
@@ -2185,41 +2573,41 @@ def datarequest_submit_emails(ctx, request_id, dao=False):
     mail_datarequest_researcher(ctx, truncated_title, resubmission, researcher_email,
                                 researcher['name'],
                                 request_id, cc, dao)
-    for pm_member in pm_members:
-        pm_email, _ = pm_member
-        if dao:
-            mail_datarequest_dao_pm(ctx, truncated_title, resubmission, pm_email, request_id,
-                                    researcher['name'],
-                                    researcher_email, researcher['institution'],
-                                    researcher['department'], timestamp, study_title)
-        else:
-            mail_datarequest_pm(ctx, truncated_title, resubmission, pm_email, request_id,
+    if dao:
+        mail_datarequest_dao_pm(ctx, truncated_title, resubmission, pm_emails, request_id,
                                 researcher['name'],
                                 researcher_email, researcher['institution'],
                                 researcher['department'], timestamp, study_title)
+    else:
+        mail_datarequest_pm(ctx, truncated_title, resubmission, pm_emails, request_id,
+                            researcher['name'],
+                            researcher_email, researcher['institution'],
+                            researcher['department'], timestamp, study_title)
 
 
 def preliminary_review_emails(ctx, request_id, datarequest_status):
+    # Nothing to send for other statuses
+    if datarequest_status not in PR_REVIEW_STATUSES:
+        return
+
     # Get (source data for) email input parameters
-    datamanager_members = group.members(ctx, GROUP_DM)
-    truncated_title     = truncated_title_get(ctx, request_id)
+    datarequest         = _json_get(ctx, datarequest_get, request_id)
+    truncated_title     = truncated_title_get(datarequest)
 
     # Email datamanager
     if datarequest_status == status.PRELIMINARY_ACCEPT:
-        for datamanager_member in datamanager_members:
-            datamanager_email, _ = datamanager_member
-            mail_preliminary_review_accepted(ctx, truncated_title, datamanager_email, request_id)
+        datamanager_emails = _member_emails(ctx, GROUP_DM)
+        mail_preliminary_review_accepted(ctx, truncated_title, datamanager_emails, request_id)
         return
 
     # Email researcher with feedback and call to action
     elif datarequest_status in (status.PRELIMINARY_REJECT, status.PRELIMINARY_RESUBMIT):
         # Get additional (source data for) email input parameters
-        datarequest             = json.loads(datarequest_get(ctx, request_id))
         researcher              = datarequest['contact']['principal_investigator']
         researcher_email        = datarequest_owner_get(ctx, request_id)
         cc                      = cc_email_addresses_get(datarequest['contact'])
-        pm_email, _             = filter(lambda x: x[0] != "rods", group.members(ctx, GROUP_PM))[0]
-        preliminary_review      = json.loads(datarequest_preliminary_review_get(ctx, request_id))
+        pm_email                = _pm_email(ctx)
+        preliminary_review      = _json_get(ctx, datarequest_preliminary_review_get, request_id)
         feedback_for_researcher = preliminary_review['feedback_for_researcher']
 
         # Send emails
@@ -2232,49 +2620,58 @@ def preliminary_review_emails(ctx, request_id, datarequest_status):
 
 
 def datamanager_review_emails(ctx, request_id, datarequest_status):
+    # Nothing to send for other statuses
+    if datarequest_status not in DM_REVIEW_STATUSES:
+        return
+
     # Get (source data for) email input parameters
-    pm_members          = group.members(ctx, GROUP_PM)
-    datamanager_review  = json.loads(datarequest_datamanager_review_get(ctx, request_id))
+    datarequest         = _json_get(ctx, datarequest_get, request_id)
+    pm_emails           = _member_emails(ctx, GROUP_PM)
+    datamanager_review  = _json_get(ctx, datarequest_datamanager_review_get, request_id)
     datamanager_remarks = (datamanager_review['datamanager_remarks'] if 'datamanager_remarks' in
                            datamanager_review else "")
-    truncated_title     = truncated_title_get(ctx, request_id)
+    truncated_title     = truncated_title_get(datarequest)
 
     # Send emails
-    for pm_member in pm_members:
-        pm_email, _ = pm_member
-        if datarequest_status   == status.DATAMANAGER_ACCEPT:
-            mail_datamanager_review_accepted(ctx, truncated_title, pm_email, request_id)
-        elif datarequest_status == status.DATAMANAGER_RESUBMIT:
-            mail_datamanager_review_resubmit(ctx, truncated_title, pm_email, datamanager_remarks,
-                                             request_id)
-        elif datarequest_status == status.DATAMANAGER_REJECT:
-            mail_datamanager_review_rejected(ctx, truncated_title, pm_email, datamanager_remarks,
-                                             request_id)
+    if datarequest_status   == status.DATAMANAGER_ACCEPT:
+        mail_datamanager_review_accepted(ctx, truncated_title, pm_emails, request_id)
+    elif datarequest_status == status.DATAMANAGER_RESUBMIT:
+        mail_datamanager_review_resubmit(ctx, truncated_title, pm_emails, datamanager_remarks,
+                                         request_id)
+    elif datarequest_status == status.DATAMANAGER_REJECT:
+        mail_datamanager_review_rejected(ctx, truncated_title, pm_emails, datamanager_remarks,
+                                         request_id)
 
 
 def assignment_emails(ctx, request_id, datarequest_status):
+    # Nothing to send for other statuses
+    if datarequest_status not in ASSIGNMENT_STATUSES:
+        return
+
     # Get (source data for) email input parameters
-    datarequest      = json.loads(datarequest_get(ctx, request_id))
+    datarequest      = _json_get(ctx, datarequest_get, request_id)
     researcher       = datarequest['contact']['principal_investigator']
     researcher_email = datarequest_owner_get(ctx, request_id)
     cc               = cc_email_addresses_get(datarequest['contact'])
-    study_title      = datarequest['datarequest']['study_information']['title']
-    assignment       = json.loads(datarequest_assignment_get(ctx, request_id))
-    truncated_title  = truncated_title_get(ctx, request_id)
+    assignment       = _json_get(ctx, datarequest_assignment_get, request_id)
+    truncated_title  = truncated_title_get(datarequest)
 
     # Send emails
     if datarequest_status == status.UNDER_REVIEW:
-        assignees = assignment['assign_to']
+        # Get additional email input parameters
+        assignees   = assignment['assign_to']
+        study_title = datarequest['datarequest']['study_information']['title']
+
+        # Send emails
         mail_assignment_accepted_researcher(ctx, truncated_title, researcher_email,
                                             researcher['name'], request_id, cc)
-        for assignee_email in assignees:
-            mail_assignment_accepted_assignee(ctx, truncated_title, assignee_email, study_title,
-                                              assignment['review_period_length'], request_id)
+        mail_assignment_accepted_assignee(ctx, truncated_title, assignees, study_title,
+                                          assignment['review_period_length'], request_id)
     elif datarequest_status in (status.RESUBMIT_AFTER_DATAMANAGER_REVIEW,
                                 status.REJECTED_AFTER_DATAMANAGER_REVIEW):
         # Get additional email input parameters
         feedback_for_researcher = assignment['feedback_for_researcher']
-        pm_email, _             = filter(lambda x: x[0] != "rods", group.members(ctx, GROUP_PM))[0]
+        pm_email                = _pm_email(ctx)
 
         # Send emails
         if datarequest_status == status.RESUBMIT_AFTER_DATAMANAGER_REVIEW:
@@ -2287,38 +2684,45 @@ def assignment_emails(ctx, request_id, datarequest_status):
 
 def review_emails(ctx, request_id):
     # Get (source data for) email input parameters
-    datarequest      = json.loads(datarequest_get(ctx, request_id))
+    datarequest      = _json_get(ctx, datarequest_get, request_id)
     researcher       = datarequest['contact']['principal_investigator']
     researcher_email = datarequest_owner_get(ctx, request_id)
     cc               = cc_email_addresses_get(datarequest['contact'])
-    pm_members       = group.members(ctx, GROUP_PM)
-    truncated_title  = truncated_title_get(ctx, request_id)
+    pm_emails        = _member_emails(ctx, GROUP_PM)
+    truncated_title  = truncated_title_get(datarequest)
 
     # Send emails
     mail_review_researcher(ctx, truncated_title, researcher_email, researcher['name'], request_id,
                            cc)
-    for pm_member in pm_members:
-        pm_email, _ = pm_member
-        mail_review_pm(ctx, truncated_title, pm_email, request_id)
+    mail_review_pm(ctx, truncated_title, pm_emails, request_id)
 
 
 def evaluation_emails(ctx, request_id, datarequest_status):
+    # Nothing to send for other statuses
+    if datarequest_status not in EVALUATION_STATUSES:
+        return
+
     # Get (source data for) email input parameters
-    datarequest             = json.loads(datarequest_get(ctx, request_id))
-    researcher              = datarequest['contact']['principal_investigator']
-    researcher_email        = datarequest_owner_get(ctx, request_id)
-    cc                      = cc_email_addresses_get(datarequest['contact'])
-    evaluation              = json.loads(datarequest_evaluation_get(ctx, request_id))
-    feedback_for_researcher = (evaluation['feedback_for_researcher'] if 'feedback_for_researcher' in
-                               evaluation else "")
-    pm_email, _             = filter(lambda x: x[0] != "rods", group.members(ctx, GROUP_PM))[0]
-    truncated_title         = truncated_title_get(ctx, request_id)
+    datarequest      = _json_get(ctx, datarequest_get, request_id)
+    researcher       = datarequest['contact']['principal_investigator']
+    researcher_email = datarequest_owner_get(ctx, request_id)
+    cc               = cc_email_addresses_get(datarequest['contact'])
+    truncated_title  = truncated_title_get(datarequest)
 
     # Send emails
     if datarequest_status == status.APPROVED:
         mail_evaluation_approved_researcher(ctx, truncated_title, researcher_email,
                                             researcher['name'], request_id, cc)
-    elif datarequest_status == status.RESUBMIT:
+        return
+
+    # Get additional email input parameters
+    evaluation              = _json_get(ctx, datarequest_evaluation_get, request_id)
+    feedback_for_researcher = (evaluation['feedback_for_researcher'] if 'feedback_for_researcher' in
+                               evaluation else "")
+    pm_email                = _pm_email(ctx)
+
+    # Send emails
+    if datarequest_status == status.RESUBMIT:
         mail_resubmit(ctx, truncated_title, researcher_email, researcher['name'],
                       feedback_for_researcher, pm_email, request_id, cc)
     elif datarequest_status == status.REJECTED:
@@ -2328,46 +2732,44 @@ def evaluation_emails(ctx, request_id, datarequest_status):
 
 def preregistration_submit_emails(ctx, request_id):
     # Get parameters
-    truncated_title  = truncated_title_get(ctx, request_id)
+    truncated_title  = truncated_title_get(_json_get(ctx, datarequest_get, request_id))
 
-    for pm_member in group.members(ctx, GROUP_PM):
-        pm_email, _ = pm_member
-        mail_preregistration_submit(ctx, truncated_title, pm_email, request_id)
+    mail_preregistration_submit(ctx, truncated_title, _member_emails(ctx, GROUP_PM), request_id)
 
 
 def datarequest_approved_emails(ctx, request_id, dao=False):
     # Get parameters
-    datarequest         = json.loads(datarequest_get(ctx, request_id))
+    datarequest         = _json_get(ctx, datarequest_get, request_id)
     researcher          = datarequest['contact']['principal_investigator']
     researcher_email    = datarequest_owner_get(ctx, request_id)
     cc                  = cc_email_addresses_get(datarequest['contact'])
-    datamanager_members = group.members(ctx, GROUP_DM)
-    truncated_title     = truncated_title_get(ctx, request_id)
+    datamanager_members = _group_members_get(ctx, GROUP_DM)
+    truncated_title     = truncated_title_get(datarequest)
 
     # Send emails
     mail_datarequest_approved_researcher(ctx, truncated_title, researcher_email,
                                          researcher['name'],
                                          request_id, cc, dao)
-    for datamanager_member in datamanager_members:
-        datamanager_email, _ = datamanager_member
-        if dao:
-            mail_datarequest_approved_dao_dm(ctx, truncated_title, datamanager_email, request_id)
-        else:
-            reviewing_dm = json.loads(datarequest_datamanager_review_get(ctx, request_id))['reviewing_dm']
+    if dao:
+        mail_datarequest_approved_dao_dm(ctx, truncated_title, _member_emails(ctx, GROUP_DM), request_id)
+    else:
+        reviewing_dm = _json_get(ctx, datarequest_datamanager_review_get, request_id)['reviewing_dm']
+        for datamanager_member in datamanager_members:
+            datamanager_email, _ = datamanager_member
             mail_datarequest_approved_dm(ctx, truncated_title, reviewing_dm, datamanager_email,
                                          request_id)
 
 
 def dta_post_upload_actions_emails(ctx, request_id):
     # Get (source data for) email input parameters
-    datarequest      = json.loads(datarequest_get(ctx, request_id))
+    datarequest      = _json_get(ctx, datarequest_get, request_id)
     researcher       = datarequest['contact']['principal_investigator']
     researcher_email = datarequest_owner_get(ctx, request_id)
     cc               = cc_email_addresses_get(datarequest['contact'])
     # (Also) cc project manager
-    pm_email, _      = filter(lambda x: x[0] != "rods", group.members(ctx, GROUP_PM))[0]
-    cc               = cc + ',{}'.format(pm_email) if cc else pm_email
-    truncated_title  = truncated_title_get(ctx, request_id)
+    pm_email         = _pm_email(ctx)
+    cc               = ",".join(address for address in (cc, pm_email) if address)
+    truncated_title  = truncated_title_get(datarequest)
 
     # Send email
     mail_dta(ctx, truncated_title, researcher_email, researcher['name'], request_id, cc)
@@ -2375,63 +2777,99 @@ def dta_post_upload_actions_emails(ctx, request_id):
 
 def signed_dta_post_upload_actions_emails(ctx, request_id):
     # Get (source data for) email input parameters
-    datamanager_members = group.members(ctx, GROUP_DM)
+    datamanager_emails  = _member_emails(ctx, GROUP_DM)
     authoring_dm        = data_object.owner(ctx, datarequest_dta_path_get(ctx, request_id))[0]
-    cc, _ = pm_email, _ = filter(lambda x: x[0] != "rods", group.members(ctx, GROUP_PM))[0]
-    truncated_title     = truncated_title_get(ctx, request_id)
+    cc                  = _pm_email(ctx)
+    truncated_title     = truncated_title_get(_json_get(ctx, datarequest_get, request_id))
 
     # Send email
-    for datamanager_member in datamanager_members:
-        datamanager_email, _ = datamanager_member
-        mail_signed_dta(ctx, truncated_title, authoring_dm, datamanager_email, request_id, cc)
+    mail_signed_dta(ctx, truncated_title, authoring_dm, datamanager_emails, request_id, cc)
 
 
 def data_ready_emails(ctx, request_id):
     # Get (source data for) email input parameters
-    datarequest      = json.loads(datarequest_get(ctx, request_id))
+    datarequest      = _json_get(ctx, datarequest_get, request_id)
     researcher       = datarequest['contact']['principal_investigator']
     researcher_email = datarequest_owner_get(ctx, request_id)
     cc               = cc_email_addresses_get(datarequest['contact'])
-    truncated_title  = truncated_title_get(ctx, request_id)
+    truncated_title  = truncated_title_get(datarequest)
 
     # Send email
     mail_data_ready(ctx, truncated_title, researcher_email, researcher['name'], request_id, cc)
 
 
+# Email routine to invoke for each datarequest status (built once at import time), called with the
+# context, request ID and status
+EMAIL_DISPATCH = {
+    status.DAO_SUBMITTED: lambda ctx, request_id, _: datarequest_submit_emails(ctx, request_id, dao=True),
+    status.SUBMITTED: lambda ctx, request_id, _: datarequest_submit_emails(ctx, request_id),
+    status.PRELIMINARY_ACCEPT: preliminary_review_emails,
+    status.PRELIMINARY_REJECT: preliminary_review_emails,
+    status.PRELIMINARY_RESUBMIT: preliminary_review_emails,
+    status.DATAMANAGER_ACCEPT: datamanager_review_emails,
+    status.DATAMANAGER_REJECT: datamanager_review_emails,
+    status.DATAMANAGER_RESUBMIT: datamanager_review_emails,
+    status.UNDER_REVIEW: assignment_emails,
+    status.REJECTED_AFTER_DATAMANAGER_REVIEW: assignment_emails,
+    status.RESUBMIT_AFTER_DATAMANAGER_REVIEW: assignment_emails,
+    status.REVIEWED: lambda ctx, request_id, _: review_emails(ctx, request_id),
+    status.APPROVED: evaluation_emails,
+    status.REJECTED: evaluation_emails,
+    status.RESUBMIT: evaluation_emails,
+    status.PREREGISTRATION_SUBMITTED: lambda ctx, request_id, _: preregistration_submit_emails(ctx, request_id),
+    status.PREREGISTRATION_CONFIRMED: lambda ctx, request_id, _: datarequest_approved_emails(ctx, request_id),
+    status.DAO_APPROVED: lambda ctx, request_id, _: datarequest_approved_emails(ctx, request_id, dao=True),
+    status.DTA_READY: lambda ctx, request_id, _: dta_post_upload_actions_emails(ctx, request_id),
+    status.DTA_SIGNED: lambda ctx, request_id, _: signed_dta_post_upload_actions_emails(ctx, request_id),
+    status.DATA_READY: lambda ctx, request_id, _: data_ready_emails(ctx, request_id)}
+
+
 ###################################################
 #                 Email templates                 #
 ###################################################
 
+def _mail_subject(request_id, truncated_title, event, dao=False):
+    """Compose the subject of a data request notification
+
+    :param request_id:      Unique identifier of the data request
+    :param truncated_title: Truncated title of the data request
+    :param event:           Event the notification is about (e.g. "submitted")
+    :param dao:             Whether the data request is for data assessment only
+
+    :returns: Subject of the notification
+    """
+    return u"YOUth data request {} (\"{}\"){}: {}".format(request_id, truncated_title,
+                                                          u" (data assessment only)" if dao else u"", event)
+
+
 def mail_datarequest_researcher(ctx, truncated_title, resubmission, researcher_email,
                                 researcher_name, request_id, cc, dao):
-    subject = u"YOUth data request {} (\"{}\") (data assessment only): {}".format(request_id, truncated_title, "resubmitted" if resubmission else "submitted") if dao else u"YOUth data request {} (\"{}\"): {}".format(request_id, truncated_title, "resubmitted" if resubmission else "submitted")
-
     return mail.send(ctx,
                      to=researcher_email,
                      cc=cc,
-                     actor=user.full_name(ctx),
-                     subject=subject,
+                     actor=_user_full_name(ctx),
+                     subject=_mail_subject(request_id, truncated_title, u"resubmitted" if resubmission else u"submitted", dao=dao),
                      body=u"""Dear {},
 
 Your data request has been submitted.
 
 You will be notified by email of the status of your request. You may also log into Yoda to view the status and other information about your data request.
 
-The following link will take you directly to your data request: https://{}/datarequest/view/{}.
+The following link will take you directly to your data request: {}/view/{}.
 
 With kind regards,
 YOUth
-""".format(researcher_name, YODA_PORTAL_FQDN, request_id))
+""".format(researcher_name, DATAREQUEST_URL, request_id))
 
 
-def mail_datarequest_pm(ctx, truncated_title, resubmission, pm_email, request_id, researcher_name,
+def mail_datarequest_pm(ctx, truncated_title, resubmission, pm_emails, request_id, researcher_name,
                         researcher_email, researcher_institution, researcher_department,
                         submission_date, proposal_title):
-    return mail.send(ctx,
-                     to=pm_email,
-                     actor=user.full_name(ctx),
-                     subject=u"YOUth data request {} (\"{}\"): {}".format(request_id, truncated_title, "resubmitted" if resubmission else "submitted"),
-                     body=u"""Dear project manager,
+    return _mail_group(ctx,
+                       pm_emails,
+                       actor=_user_full_name(ctx),
+                       subject=_mail_subject(request_id, truncated_title, u"resubmitted" if resubmission else u"submitted"),
+                       body=u"""Dear project manager,
 
 A new data request has been submitted.
 
@@ -2441,22 +2879,22 @@ Date: {}
 Request ID: {}
 Proposal title: {}
 
-The following link will take you to the preliminary review form: https://{}/datarequest/preliminary_review/{}.
+The following link will take you to the preliminary review form: {}/preliminary_review/{}.
 
 With kind regards,
 YOUth
 """.format(researcher_name, researcher_email, researcher_institution, researcher_department,
-                         submission_date, request_id, proposal_title, YODA_PORTAL_FQDN, request_id))
+                           submission_date, request_id, proposal_title, DATAREQUEST_URL, request_id))
 
 
-def mail_datarequest_dao_pm(ctx, truncated_title, resubmission, pm_email, request_id,
+def mail_datarequest_dao_pm(ctx, truncated_title, resubmission, pm_emails, request_id,
                             researcher_name, researcher_email, researcher_institution,
                             researcher_department, submission_date, proposal_title):
-    return mail.send(ctx,
-                     to=pm_email,
-                     actor=user.full_name(ctx),
-                     subject=u"YOUth data request {} (\"{}\") (data assessment only): {}".format(request_id, truncated_title, "resubmitted" if resubmission else "submitted"),
-                     body=u"""Dear project manager,
+    return _mail_group(ctx,
+                       pm_emails,
+                       actor=_user_full_name(ctx),
+                       subject=_mail_subject(request_id, truncated_title, u"resubmitted" if resubmission else u"submitted", dao=True),
+                       body=u"""Dear project manager,
 
 A new data request (for the purpose of data assessment only) has been submitted.
 
@@ -2466,149 +2904,149 @@ Date: {}
 Request ID: {}
 Proposal title: {}
 
-The following link will take you to the evaluation form: https://{}/datarequest/evaluate/{}.
+The following link will take you to the evaluation form: {}/evaluate/{}.
 
 With kind regards,
 YOUth
 """.format(researcher_name, researcher_email, researcher_institution, researcher_department,
-                         submission_date, request_id, proposal_title, YODA_PORTAL_FQDN, request_id))
+                           submission_date, request_id, proposal_title, DATAREQUEST_URL, request_id))
 
 
-def mail_preliminary_review_accepted(ctx, truncated_title, datamanager_email, request_id):
-    return mail.send(ctx,
-                     to=datamanager_email,
-                     actor=user.full_name(ctx),
-                     subject=u"YOUth data request {} (\"{}\"): accepted for data manager review".format(request_id, truncated_title),
-                     body=u"""Dear data manager,
+def mail_preliminary_review_accepted(ctx, truncated_title, datamanager_emails, request_id):
+    return _mail_group(ctx,
+                       datamanager_emails,
+                       actor=_user_full_name(ctx),
+                       subject=_mail_subject(request_id, truncated_title, u"accepted for data manager review"),
+                       body=u"""Dear data manager,
 
 Data request {} has been approved for review by the YOUth project manager.
 
 You are now asked to review the data request for any potential problems concerning the requested data and to submit your recommendation (accept, resubmit, or reject) to the YOUth project manager.
 
-The following link will take you directly to the review form: https://{}/datarequest/datamanager_review/{}.
+The following link will take you directly to the review form: {}/datamanager_review/{}.
 
 With kind regards,
 YOUth
-""".format(request_id, YODA_PORTAL_FQDN, request_id))
+""".format(request_id, DATAREQUEST_URL, request_id))
 
 
-def mail_datamanager_review_accepted(ctx, truncated_title, pm_email, request_id):
-    return mail.send(ctx,
-                     to=pm_email,
-                     actor=user.full_name(ctx),
-                     subject=u"YOUth data request {} (\"{}\"): accepted by data manager".format(request_id, truncated_title),
-                     body=u"""Dear project manager,
+def mail_datamanager_review_accepted(ctx, truncated_title, pm_emails, request_id):
+    return _mail_group(ctx,
+                       pm_emails,
+                       actor=_user_full_name(ctx),
+                       subject=_mail_subject(request_id, truncated_title, u"accepted by data manager"),
+                       body=u"""Dear project manager,
 
 Data request {} has been accepted by the data manager.
 
-The data manager's review is advisory. Please review the data manager's review (and if accepted, assign the data request for review to one or more DAC members). To do so, please navigate to the assignment form using this link https://{}/datarequest/assign/{}.
+The data manager's review is advisory. Please review the data manager's review (and if accepted, assign the data request for review to one or more DAC members). To do so, please navigate to the assignment form using this link {}/assign/{}.
 
 With kind regards,
 YOUth
-""".format(request_id, YODA_PORTAL_FQDN, request_id))
+""".format(request_id, DATAREQUEST_URL, request_id))
 
 
-def mail_datamanager_review_resubmit(ctx, truncated_title, pm_email, datamanager_remarks, request_id):
-    return mail.send(ctx,
-                     to=pm_email,
-                     actor=user.full_name(ctx),
-                     subject=u"YOUth data request {} (\"{}\"): rejected (resubmit) by data manager".format(request_id, truncated_title),
-                     body=u"""Dear project manager,
+def mail_datamanager_review_resubmit(ctx, truncated_title, pm_emails, datamanager_remarks, request_id):
+    return _mail_group(ctx,
+                       pm_emails,
+                       actor=_user_full_name(ctx),
+                       subject=_mail_subject(request_id, truncated_title, u"rejected (resubmit) by data manager"),
+                       body=u"""Dear project manager,
 
 Data request {} has been rejected (resubmission allowed) by the data manager for the following reason(s):
 
 {}
 
-The data manager's review is advisory. Please review the data manager's review (and if accepted, assign the data request for review to one or more DAC members). To do so, please navigate to the assignment form using this link https://{}/datarequest/assign/{}.
+The data manager's review is advisory. Please review the data manager's review (and if accepted, assign the data request for review to one or more DAC members). To do so, please navigate to the assignment form using this link {}/assign/{}.
 
 With kind regards,
 YOUth
-""".format(request_id, datamanager_remarks, YODA_PORTAL_FQDN, request_id))
+""".format(request_id, datamanager_remarks, DATAREQUEST_URL, request_id))
 
 
-def mail_datamanager_review_rejected(ctx, truncated_title, pm_email, datamanager_remarks, request_id):
-    return mail.send(ctx,
-                     to=pm_email,
-                     actor=user.full_name(ctx),
-                     subject=u"YOUth data request {} (\"{}\"): rejected by data manager".format(request_id, truncated_title),
-                     body=u"""Dear project manager,
+def mail_datamanager_review_rejected(ctx, truncated_title, pm_emails, datamanager_remarks, request_id):
+    return _mail_group(ctx,
+                       pm_emails,
+                       actor=_user_full_name(ctx),
+                       subject=_mail_subject(request_id, truncated_title, u"rejected by data manager"),
+                       body=u"""Dear project manager,
 
 Data request {} has been rejected by the data manager for the following reason(s):
 
 {}
 
-The data manager's review is advisory. Please review the data manager's review (and if accepted, assign the data request for review to one or more DAC members). To do so, please navigate to the assignment form using this link https://{}/datarequest/assign/{}.
+The data manager's review is advisory. Please review the data manager's review (and if accepted, assign the data request for review to one or more DAC members). To do so, please navigate to the assignment form using this link {}/assign/{}.
 
 With kind regards,
 YOUth
-""".format(request_id, datamanager_remarks, YODA_PORTAL_FQDN, request_id))
+""".format(request_id, datamanager_remarks, DATAREQUEST_URL, request_id))
 
 
 def mail_assignment_accepted_researcher(ctx, truncated_title, researcher_email, researcher_name, request_id, cc):
     return mail.send(ctx,
                      to=researcher_email,
                      cc=cc,
-                     actor=user.full_name(ctx),
-                     subject=u"YOUth data request {} (\"{}\"): under review".format(request_id, truncated_title),
+                     actor=_user_full_name(ctx),
+                     subject=_mail_subject(request_id, truncated_title, u"under review"),
                      body=u"""Dear {},
 
 Your data request has passed a preliminary assessment and is now under review.
 
-The following link will take you directly to your data request: https://{}/datarequest/view/{}.
+The following link will take you directly to your data request: {}/view/{}.
 
 With kind regards,
 YOUth
-""".format(researcher_name, YODA_PORTAL_FQDN, request_id))
+""".format(researcher_name, DATAREQUEST_URL, request_id))
 
 
-def mail_assignment_accepted_assignee(ctx, truncated_title, assignee_email, proposal_title,
+def mail_assignment_accepted_assignee(ctx, truncated_title, assignee_emails, proposal_title,
                                       review_period_length, request_id):
-    return mail.send(ctx,
-                     to=assignee_email,
-                     actor=user.full_name(ctx),
-                     subject=u"YOUth data request {} (\"{}\"): assigned".format(request_id, truncated_title),
-                     body=u"""Dear DAC member,
+    return _mail_group(ctx,
+                       assignee_emails,
+                       actor=_user_full_name(ctx),
+                       subject=_mail_subject(request_id, truncated_title, u"assigned"),
+                       body=u"""Dear DAC member,
 
 Data request {} (proposal title: \"{}\") has been assigned to you for review. Please sign in to Yoda to view the data request and submit your review within {} days.
 
-The following link will take you directly to the review form: https://{}/datarequest/review/{}.
+The following link will take you directly to the review form: {}/review/{}.
 
 With kind regards,
 YOUth
-""".format(request_id, proposal_title, review_period_length, YODA_PORTAL_FQDN, request_id))
+""".format(request_id, proposal_title, review_period_length, DATAREQUEST_URL, request_id))
 
 
 def mail_review_researcher(ctx, truncated_title, researcher_email, researcher_name, request_id, cc):
     return mail.send(ctx,
                      to=researcher_email,
                      cc=cc,
-                     actor=user.full_name(ctx),
-                     subject=u"YOUth data request {} (\"{}\"): reviewed".format(request_id, truncated_title),
+                     actor=_user_full_name(ctx),
+                     subject=_mail_subject(request_id, truncated_title, u"reviewed"),
                      body=u"""Dear {},
 
 Your data request been reviewed by the YOUth Data Access Committee and is awaiting final evaluation by the YOUth project manager.
 
-The following link will take you directly to your data request: https://{}/datarequest/view/{}.
+The following link will take you directly to your data request: {}/view/{}.
 
 With kind regards,
 YOUth
-""".format(researcher_name, YODA_PORTAL_FQDN, request_id))
+""".format(researcher_name, DATAREQUEST_URL, request_id))
 
 
-def mail_review_pm(ctx, truncated_title, pm_email, request_id):
-    return mail.send(ctx,
-                     to=pm_email,
-                     actor=user.full_name(ctx),
-                     subject=u"YOUth data request {} (\"{}\"): reviewed".format(request_id, truncated_title),
-                     body=u"""Dear project manager,
+def mail_review_pm(ctx, truncated_title, pm_emails, request_id):
+    return _mail_group(ctx,
+                       pm_emails,
+                       actor=_user_full_name(ctx),
+                       subject=_mail_subject(request_id, truncated_title, u"reviewed"),
+                       body=u"""Dear project manager,
 
 Data request {} has been reviewed by the YOUth Data Access Committee and is awaiting your final evaluation.
 
-Please log into Yoda to evaluate the data request. The following link will take you directly to the evaluation form: https://{}/datarequest/evaluate/{}.
+Please log into Yoda to evaluate the data request. The following link will take you directly to the evaluation form: {}/evaluate/{}.
 
 With kind regards,
 YOUth
-""".format(request_id, YODA_PORTAL_FQDN, request_id))
+""".format(request_id, DATAREQUEST_URL, request_id))
 
 
 def mail_evaluation_approved_researcher(ctx, truncated_title, researcher_email, researcher_name,
@@ -2616,78 +3054,78 @@ def mail_evaluation_approved_researcher(ctx, truncated_title, researcher_email,
     return mail.send(ctx,
                      to=researcher_email,
                      cc=cc,
-                     actor=user.full_name(ctx),
-                     subject=u"YOUth data request {} (\"{}\"): approved".format(request_id, truncated_title),
+                     actor=_user_full_name(ctx),
+                     subject=_mail_subject(request_id, truncated_title, u"approved"),
                      body=u"""Dear {},
 
-Congratulations! Your data request has been approved. You are now asked to preregister your study in the YOUth Open Science Framework preregistry. To do so, please navigate to the preregistration form using this link: https://{}/datarequest/preregister/{}.
+Congratulations! Your data request has been approved. You are now asked to preregister your study in the YOUth Open Science Framework preregistry. To do so, please navigate to the preregistration form using this link: {}/preregister/{}.
 
 With kind regards,
 YOUth
-""".format(researcher_name, YODA_PORTAL_FQDN, request_id))
+""".format(researcher_name, DATAREQUEST_URL, request_id))
 
 
-def mail_preregistration_submit(ctx, truncated_title, pm_email, request_id):
-    return mail.send(ctx,
-                     to=pm_email,
-                     actor=user.full_name(ctx),
-                     subject=u"YOUth data request {} (\"{}\"): preregistration submitted".format(request_id, truncated_title),
-                     body=u"""Dear project manager,
+def mail_preregistration_submit(ctx, truncated_title, pm_emails, request_id):
+    return _mail_group(ctx,
+                       pm_emails,
+                       actor=_user_full_name(ctx),
+                       subject=_mail_subject(request_id, truncated_title, u"preregistration submitted"),
+                       body=u"""Dear project manager,
 
-Data request {} has been preregistered by the researcher. You are now asked to review and confirm the preregistration. The following link will take you directly to the data request, where you may confirm the preregistration: https://{}/datarequest/view/{}.
+Data request {} has been preregistered by the researcher. You are now asked to review and confirm the preregistration. The following link will take you directly to the data request, where you may confirm the preregistration: {}/view/{}.
 
 With kind regards,
 YOUth
-""".format(request_id, YODA_PORTAL_FQDN, request_id))
+""".format(request_id, DATAREQUEST_URL, request_id))
 
 
 def mail_datarequest_approved_dm(ctx, truncated_title, reviewing_dm, datamanager_email, request_id):
     return mail.send(ctx,
                      to=datamanager_email,
-                     actor=user.full_name(ctx),
-                     subject=u"YOUth data request {} (\"{}\"): approved".format(request_id, truncated_title),
+                     actor=_user_full_name(ctx),
+                     subject=_mail_subject(request_id, truncated_title, u"approved"),
                      body=u"""Dear data manager,
 
 Data request {} has been approved by the YOUth project manager (and has passed the data manager review of {}). Please sign in to Yoda to upload a Data Transfer Agreement for the researcher.
 
-The following link will take you directly to the data request: https://{}/datarequest/view/{}.
+The following link will take you directly to the data request: {}/view/{}.
 
 With kind regards,
 YOUth
-""".format(request_id, reviewing_dm, YODA_PORTAL_FQDN, request_id))
+""".format(request_id, reviewing_dm, DATAREQUEST_URL, request_id))
 
 
-def mail_datarequest_approved_dao_dm(ctx, truncated_title, datamanager_email, request_id):
-    return mail.send(ctx,
-                     to=datamanager_email,
-                     actor=user.full_name(ctx),
-                     subject=u"YOUth data request {} (\"{}\") (data assessment only): approved".format(request_id, truncated_title),
-                     body=u"""Dear data manager,
+def mail_datarequest_approved_dao_dm(ctx, truncated_title, datamanager_emails, request_id):
+    return _mail_group(ctx,
+                       datamanager_emails,
+                       actor=_user_full_name(ctx),
+                       subject=_mail_subject(request_id, truncated_title, u"approved", dao=True),
+                       body=u"""Dear data manager,
 
 Data request {} has been approved by the YOUth project manager. Please sign in to Yoda to upload a Data Transfer Agreement for the researcher.
 
-The following link will take you directly to the data request: https://{}/datarequest/view/{}.
+The following link will take you directly to the data request: {}/view/{}.
 
 With kind regards,
 YOUth
-""".format(request_id, YODA_PORTAL_FQDN, request_id))
+""".format(request_id, DATAREQUEST_URL, request_id))
 
 
 def mail_datarequest_approved_researcher(ctx, truncated_title, researcher_email, researcher_name, request_id, cc, dao=False):
     return mail.send(ctx,
                      to=researcher_email,
                      cc=cc,
-                     actor=user.full_name(ctx),
-                     subject=(u"YOUth data request {} (\"{}\") (data assessment only): approved".format(request_id, truncated_title) if dao else "YOUth data request {} (\"{}\"): preregistration approved".format(request_id, truncated_title)),
+                     actor=_user_full_name(ctx),
+                     subject=_mail_subject(request_id, truncated_title, u"approved" if dao else u"preregistration approved", dao=dao),
                      body=u"""Dear {},
 
 The preregistration of your data request has been approved. The YOUth data manager will now create a Data Transfer Agreement for you to sign. You will be notified when it is ready.
 
-The following link will take you directly to the data request: https://{}/datarequest/view/{}.
+The following link will take you directly to the data request: {}/view/{}.
 
 With kind regards,
 YOUth
-""".format(researcher_name, YODA_PORTAL_FQDN, request_id))
+""".format(researcher_name, DATAREQUEST_URL, request_id))
 
 
 def mail_resubmit(ctx, truncated_title, researcher_email, researcher_name, feedback_for_researcher, pm_email,
@@ -2695,24 +3133,24 @@ def mail_resubmit(ctx, truncated_title, researcher_email, researcher_name, feedb
     return mail.send(ctx,
                      to=researcher_email,
                      cc=cc,
-                     actor=user.full_name(ctx),
-                     subject=u"YOUth data request {} (\"{}\"): rejected (resubmit)".format(request_id, truncated_title),
+                     actor=_user_full_name(ctx),
+                     subject=_mail_subject(request_id, truncated_title, u"rejected (resubmit)"),
                      body=u"""Dear {},
 
 Your data request has been rejected for the following reason(s):
 
 {}
 
-You are however allowed to resubmit your data request. You may do so using this link: https://{}/datarequest/add/{}.
+You are however allowed to resubmit your data request. You may do so using this link: {}/add/{}.
 
 If you wish to object against this rejection, please contact the YOUth project manager ({}).
 
-The following link will take you directly to your data request: https://{}/datarequest/view/{}.
+The following link will take you directly to your data request: {}/view/{}.
 
 With kind regards,
 YOUth
-""".format(researcher_name, feedback_for_researcher, YODA_PORTAL_FQDN, request_id, pm_email,
-                         YODA_PORTAL_FQDN, request_id))
+""".format(researcher_name, feedback_for_researcher, DATAREQUEST_URL, request_id, pm_email,
+                         DATAREQUEST_URL, request_id))
 
 
 def mail_rejected(ctx, truncated_title, researcher_email, researcher_name, feedback_for_researcher, pm_email,
@@ -2720,8 +3158,8 @@ def mail_rejected(ctx, truncated_title, researcher_email, researcher_name, feedb
     return mail.send(ctx,
                      to=researcher_email,
                      cc=cc,
-                     actor=user.full_name(ctx),
-                     subject=u"YOUth data request {} (\"{}\"): rejected".format(request_id, truncated_title),
+                     actor=_user_full_name(ctx),
+                     subject=_mail_subject(request_id, truncated_title, u"rejected"),
                      body=u"""Dear {},
 
 Your data request has been rejected for the following reason(s):
@@ -2730,57 +3168,57 @@ Your data request has been rejected for the following reason(s):
 
 If you wish to object against this rejection, please contact the YOUth project manager ({}).
 
-The following link will take you directly to your data request: https://{}/datarequest/view/{}.
+The following link will take you directly to your data request: {}/view/{}.
 
 With kind regards,
 YOUth
-""".format(researcher_name, feedback_for_researcher, pm_email, YODA_PORTAL_FQDN, request_id))
+""".format(researcher_name, feedback_for_researcher, pm_email, DATAREQUEST_URL, request_id))
 
 
 def mail_dta(ctx, truncated_title, researcher_email, researcher_name, request_id, cc):
     return mail.send(ctx,
                      to=researcher_email,
                      cc=cc,
-                     actor=user.full_name(ctx),
-                     subject=u"YOUth data request {} (\"{}\"): DTA ready".format(request_id, truncated_title),
+                     actor=_user_full_name(ctx),
+                     subject=_mail_subject(request_id, truncated_title, u"DTA ready"),
                      body=u"""Dear {},
 
 The YOUth data manager has created a Data Transfer Agreement to formalize the transfer of the data you have requested. Please sign in to Yoda to download and read the Data Transfer Agreement.
 
-The following link will take you directly to your data request: https://{}/datarequest/view/{}.
+The following link will take you directly to your data request: {}/view/{}.
 
 If you do not object to the agreement, please upload a signed copy of the agreement. After this, the YOUth data manager will prepare the requested data and will provide you with instructions on how to download them.
 
 With kind regards,
 YOUth
-""".format(researcher_name, YODA_PORTAL_FQDN, request_id))
+""".format(researcher_name, DATAREQUEST_URL, request_id))
 
 
-def mail_signed_dta(ctx, truncated_title, authoring_dm, datamanager_email, request_id, cc):
-    return mail.send(ctx,
-                     to=datamanager_email,
-                     cc=cc,
-                     actor=user.full_name(ctx),
-                     subject=u"YOUth data request {} (\"{}\"): DTA signed".format(request_id, truncated_title),
-                     body=u"""Dear data manager,
+def mail_signed_dta(ctx, truncated_title, authoring_dm, datamanager_emails, request_id, cc):
+    return _mail_group(ctx,
+                       datamanager_emails,
+                       cc=cc,
+                       actor=_user_full_name(ctx),
+                       subject=_mail_subject(request_id, truncated_title, u"DTA signed"),
+                       body=u"""Dear data manager,
 
 The researcher has uploaded a signed copy of the Data Transfer Agreement for data request {}. The DTA was authored by {}.
 
-Please log in to Yoda to review this copy. The following link will take you directly to the data request: https://{}/datarequest/view/{}.
+Please log in to Yoda to review this copy. The following link will take you directly to the data request: {}/view/{}.
 
 After verifying that the document has been signed correctly, you may prepare the data for download. When the data is ready for the researcher to download, please click the \"Data ready\" button. This will notify the researcher by email that the requested data is ready. The email will include instructions on downloading the data.
 
 With kind regards,
 YOUth
-""".format(request_id, authoring_dm, YODA_PORTAL_FQDN, request_id))
+""".format(request_id, authoring_dm, DATAREQUEST_URL, request_id))
 
 
 def mail_data_ready(ctx, truncated_title, researcher_email, researcher_name, request_id, cc):
     return mail.send(ctx,
                      to=researcher_email,
                      cc=cc,
-                     actor=user.full_name(ctx),
-                     subject=u"YOUth data request {} (\"{}\"): data ready".format(request_id, truncated_title),
+                     actor=_user_full_name(ctx),
+                     subject=_mail_subject(request_id, truncated_title, u"data ready"),
                      body=u"""Dear {},
 
 The data you have requested has been made available to you within a new folder in Yoda. You can access the data through the webportal in the "research" area or you can connect Yoda as a network drive and access the data through your file explorer. For information on how to access the data, see https://www.uu.nl/en/research/yoda/guide-to-yoda/i-want-to-start-using-yoda
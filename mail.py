@@ -4,6 +4,7 @@
 __copyright__ = 'Copyright (c) 2020-2022, Utrecht University'
 __license__   = 'GPLv3, see LICENSE'
 
+import contextlib
 import email
 import re
 import smtplib
@@ -14,31 +15,11 @@ from util import *
 __all__ = ['rule_mail_test']
 
 
-def send(ctx, to, actor, subject, body, cc=None):
-    """Send an e-mail with specified recipient, subject and body.
-
-    The originating address and mail server credentials are taken from the
-    ruleset configuration file.
-
-    :param ctx:     Combined type of a callback and rei struct
-    :param to:      Recipient of the mail
-    :param actor:   Actor of the mail
-    :param subject: Subject of mail
-    :param body:    Body of mail
-    :param cc:      Comma-separated list of CC recipient(s) of email (optional)
+def _config():
+    """Get the sender and mail server settings from the ruleset configuration.
 
-    :returns: API status
+    :returns: Dict with mail settings
     """
-    if not config.notifications_enabled:
-        log.write(ctx, 'Sending mail notifications is disabled')
-        return
-
-    if '@' not in to:
-        log.write(ctx, 'Ignoring invalid destination <{}>'.format(to))
-        return  # Silently ignore obviously invalid destinations (mimic old behavior).
-
-    log.write(ctx, u'Sending mail for <{}> to <{}>, subject <{}>'.format(actor, to, subject))
-
     cfg = {k: getattr(config, v)
            for k, v in [('from',      'notifications_sender_email'),
                         ('from_name', 'notifications_sender_name'),
@@ -49,6 +30,17 @@ def send(ctx, to, actor, subject, body, cc=None):
         cfg['username'] = getattr(config, "smtp_username")
         cfg['password'] = getattr(config, "smtp_password")
 
+    return cfg
+
+
+def _connect(ctx, cfg):
+    """Open an (authenticated) connection to the configured mail server.
+
+    :param ctx: Combined type of a callback and rei struct
+    :param cfg: Mail settings, as returned by _config()
+
+    :returns: SMTP connection, or API error on failure
+    """
     try:
         # e.g. 'smtps://smtp.gmail.com:465' for SMTP over TLS, or
         # 'smtp://smtp.gmail.com:587' for STARTTLS on the mail submission port.
@@ -81,6 +73,94 @@ def send(ctx, to, actor, subject, body, cc=None):
         log.write(ctx, 'Could not login to mail server with configured credentials')
         return api.Error('internal', 'Mail configuration error')
 
+    return smtp
+
+
+def _disconnect(smtp):
+    """Close a connection to the mail server, ignoring errors.
+
+    :param smtp: SMTP connection
+    """
+    try:
+        smtp.quit()
+    except Exception:
+        pass
+
+
+@contextlib.contextmanager
+def session(ctx):
+    """Send all mails within a block over a single connection to the mail server.
+
+    The connection is opened when the first mail is sent and closed at the end
+    of the block, which saves a connect, TLS handshake and login per mail when
+    several mails are sent in a row.
+
+    Synopsis:
+
+        with mail.session(ctx):
+            mail.send(ctx, ...)
+            mail.send(ctx, ...)
+
+    :param ctx: Combined type of a callback and rei struct
+
+    :returns: Context manager
+    """
+    if '_mail_session' in ctx.__dict__:
+        # Already in a session: reuse its connection.
+        yield
+        return
+
+    ctx.__dict__['_mail_session'] = {}
+    try:
+        yield
+    finally:
+        smtp = ctx.__dict__.pop('_mail_session').get('smtp')
+        if smtp is not None:
+            _disconnect(smtp)
+
+
+def send(ctx, to, actor, subject, body, cc=None, bcc=None):
+    """Send an e-mail with specified recipient, subject and body.
+
+    The originating address and mail server credentials are taken from the
+    ruleset configuration file. Within a mail session (see session()) the
+    connection to the mail server is shared with other mails.
+
+    :param ctx:     Combined type of a callback and rei struct
+    :param to:      Recipient of the mail
+    :param actor:   Actor of the mail
+    :param subject: Subject of mail
+    :param body:    Body of mail
+    :param cc:      Comma-separated list of CC recipient(s) of email (optional)
+    :param bcc:     List of BCC recipient(s) of email, who receive the same message without being
+                    listed in its headers (optional)
+
+    :returns: API status
+    """
+    if not config.notifications_enabled:
+        log.write(ctx, 'Sending mail notifications is disabled')
+        return
+
+    if '@' not in to:
+        log.write(ctx, 'Ignoring invalid destination <{}>'.format(to))
+        return  # Silently ignore obviously invalid destinations (mimic old behavior).
+
+    if bcc:
+        log.write(ctx, u'Sending mail for <{}> to <{}> (bcc <{}>), subject <{}>'.format(actor, to, ', '.join(bcc), subject))
+    else:
+        log.write(ctx, u'Sending mail for <{}> to <{}>, subject <{}>'.format(actor, to, subject))
+
+    cfg = _config()
+
+    mail_session = ctx.__dict__.get('_mail_session')
+    smtp = None if mail_session is None else mail_session.get('smtp')
+    if smtp is None:
+        smtp = _connect(ctx, cfg)
+        if type(smtp) is api.Error:
+            return smtp
+        if mail_session is not None:
+            mail_session['smtp'] = smtp
+
     fmt_addr = '{} <{}>'.format
 
     msg = MIMEText(body, 'plain', 'UTF-8')
@@ -93,19 +173,24 @@ def send(ctx, to, actor, subject, body, cc=None):
     if cc is not None:
         msg['Cc'] = cc
 
+    recipients = [to]
+    if cc is not None:
+        recipients += cc.split(',')
+    if bcc:
+        recipients += bcc
+
     try:
-        if cc is not None:
-            smtp.sendmail(cfg['from'], [to] + cc.split(','), msg.as_string())
-        else:
-            smtp.sendmail(cfg['from'], [to], msg.as_string())
+        smtp.sendmail(cfg['from'], recipients, msg.as_string())
     except Exception as e:
         log.write(ctx, 'Could not send mail: {}'.format(e))
+        if mail_session is not None:
+            # Do not reuse a connection that may be broken.
+            mail_session.pop('smtp', None)
+            _disconnect(smtp)
         return api.Error('internal', 'Mail configuration error')
 
-    try:
-        smtp.quit()
-    except Exception:
-        pass
+    if mail_session is None:
+        _disconnect(smtp)
 
 
 def wrapper(ctx, to, actor, subject, body):
@@ -11,6 +11,17 @@ import provenance
 import vault
 from util import *
 
+# Valid datapackage transitions as pairs of AVU values, for cheap membership tests.
+_TRANSITION_VALUES = frozenset((status_from.value, status_to.value)
+                               for status_from, status_to in constants.datapackage_transitions)
+
+
+def _status_value(status):
+    """Return the AVU value of a vault package state, given either the state or its value."""
+    if isinstance(status, constants.vault_package_state):
+        return status.value
+    return status
+
 
 def pre_status_transition(ctx, coll, current, new):
     """Action taken before status transition."""
@@ -23,9 +34,8 @@ def pre_status_transition(ctx, coll, current, new):
 
 
 def can_transition_datapackage_status(ctx, actor, coll, status_from, status_to):
-    transition = (constants.vault_package_state(status_from),
-                  constants.vault_package_state(status_to))
-    if transition not in constants.datapackage_transitions:
+    transition = (_status_value(status_from), _status_value(status_to))
+    if transition not in _TRANSITION_VALUES:
         return policy.fail('Illegal status transition')
 
     if status_to is constants.vault_package_state.SUBMITTED_FOR_PUBLICATION:
@@ -8,6 +8,7 @@ import json
 import os
 import time
 from collections import OrderedDict
+from functools import lru_cache
 from urllib.parse import urlparse
 
 from pytest_bdd import (
@@ -82,6 +83,14 @@ def api_folder_accept(user, folder):
     )
 
 
+@lru_cache(maxsize=None)
+def metadata_json_load(schema):
+    """Load the example metadata JSON for a schema, once per test session."""
+    cwd = os.getcwd()
+    with open("{}/files/{}.json".format(cwd, schema), encoding="utf8") as f:
+        return json.loads(f.read(), object_pairs_hook=OrderedDict)
+
+
 @given(parsers.parse("metadata JSON exists in {folder}"))
 def api_response(user, folder):
     api_request(
@@ -99,9 +108,7 @@ def api_response(user, folder):
     path = urlparse(body['data']['schema']['$id']).path
     schema = path.split("/")[2]
 
-    cwd = os.getcwd()
-    with open("{}/files/{}.json".format(cwd, schema), encoding="utf8") as f:
-        metadata = json.loads(f.read(), object_pairs_hook=OrderedDict)
+    metadata = metadata_json_load(schema)
 
     http_status, _ = api_request(
         user,
@@ -17,7 +17,7 @@ scenarios('../../features/api/api_meta.feature')
 
 
 @given(parsers.parse("cloned metadata JSON exists in {clone_collection}"))
-def metadata_removed(user, clone_collection):
+def cloned_metadata_exists(user, clone_collection):
     http_status, body = api_request(
         user,
         "browse_folder",
@@ -27,12 +27,7 @@ def metadata_removed(user, clone_collection):
     assert http_status == 200
 
     # Check if yoda-metadata.json is in browse results of collection.
-    found = False
-    for item in body['data']['items']:
-        if item["name"] == "yoda-metadata.json":
-            found = True
-
-    assert found
+    assert any(item["name"] == "yoda-metadata.json" for item in body['data']['items'])
 
 
 @given(parsers.parse("subcollection {target_coll} exists"))
@@ -67,7 +62,7 @@ def api_meta_remove(user, clone_collection):
 
 
 @given(parsers.parse("the Yoda meta clone file API is queried with {target_coll}"), target_fixture="api_response")
-def api_response(user, target_coll):
+def api_meta_clone_file(user, target_coll):
     return api_request(
         user,
         "meta_clone_file",
@@ -76,7 +71,7 @@ def api_response(user, target_coll):
 
 
 @then(parsers.parse("metadata JSON is removed from {clone_collection}"))
-def metadata_removed_collection(user, clone_collection):
+def metadata_removed(user, clone_collection):
     http_status, body = api_request(
         user,
         "browse_folder",
@@ -85,13 +80,8 @@ def metadata_removed_collection(user, clone_collection):
 
     assert http_status == 200
 
-    # Check if yoda-metadata.json is in browse results of collection.
-    found = True
-    for item in body['data']['items']:
-        if item["name"] == "yoda-metadata.json":
-            found = False
-
-    assert found
+    # Check that yoda-metadata.json is not in browse results of collection.
+    assert not any(item["name"] == "yoda-metadata.json" for item in body['data']['items'])
 
 
 @then(parsers.parse("metadata JSON is cloned into {target_coll}"))
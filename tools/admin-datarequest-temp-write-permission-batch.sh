@@ -0,0 +1,2 @@
+#!/bin/sh
+irule -r irods_rule_engine_plugin-irods_rule_language-instance -F /etc/irods/yoda-ruleset/tools/process-datarequest-temp-write-permission-batch.r "'$1'" "'$2'" "'$3'" "'$4'" "'$5'"
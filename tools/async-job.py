@@ -5,6 +5,7 @@ import argparse
 import os
 import subprocess
 import sys
+import time
 import atexit
 
 # usage: ./async-data-replicate.py
@@ -33,6 +34,12 @@ def get_args():
                         help='Maximum number of items to be processed per batch job')
     parser.add_argument('--dry-run', '-n', action='store_const', default="0", const="1",
                         help='Perform a trial run for troubleshooting purposes')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Number of batch jobs to run in parallel, each on its own part of the balance id range')
+    parser.add_argument('--daemon', action='store_true',
+                        help='Keep running and start a new batch job every --interval seconds')
+    parser.add_argument('--interval', type=int, default=60,
+                        help='Number of seconds to wait between batch jobs in daemon mode')
     return parser.parse_args()
 
 
@@ -58,16 +65,64 @@ def lock_or_die(balance_id_min, balance_id_max):
     atexit.register(lambda: os.unlink(LOCKFILE_PATH))
 
 
-if 'replicate' in NAME:
-    rule_name = 'uuReplicateBatch(*verbose, *balance_id_min, *balance_id_max, *batch_size_limit, *dry_run)'
-elif 'revision' in NAME:
-    rule_name = 'uuRevisionBatch(*verbose, *balance_id_min, *balance_id_max, *batch_size_limit, *dry_run)'
-else:
+# Batch rule to run, by job type (part of the name this script is called by).
+RULES = {'replicate': 'uuReplicateBatch(*verbose, *balance_id_min, *balance_id_max, *batch_size_limit, *dry_run)',
+         'revision':  'uuRevisionBatch(*verbose, *balance_id_min, *balance_id_max, *batch_size_limit, *dry_run)'}
+
+rule_name = next((rule for job_type, rule in RULES.items() if job_type in NAME), None)
+if rule_name is None:
     print('bad command "{}"'.format(NAME), file=sys.stderr)
     exit(1)
 
+
+def balance_id_ranges(balance_id_min, balance_id_max, workers):
+    """Split the balance id range into (at most) the given number of contiguous sub-ranges of near-equal size."""
+    total = balance_id_max - balance_id_min + 1
+    workers = max(1, min(workers, total))
+
+    ranges = []
+    start = balance_id_min
+    for i in range(workers):
+        size = total // workers + (1 if i < total % workers else 0)
+        ranges.append((start, start + size - 1))
+        start += size
+    return ranges
+
+
+def run_once(args):
+    """Run a single batch job for the balance id range of this job.
+       With multiple workers, each part of the range is handled by its own irule process in parallel.
+       Returns whether the batch jobs for all parts of the range succeeded.
+    """
+    processes = []
+    for balance_id_min, balance_id_max in balance_id_ranges(args.balance_id_min, args.balance_id_max, args.workers):
+        options = (('verbose',          args.verbose),
+                   ('balance_id_min',   balance_id_min),
+                   ('balance_id_max',   balance_id_max),
+                   ('batch_size_limit', args.batch_size_limit),
+                   ('dry_run',          args.dry_run))
+        rule_options = '%'.join('*{}={}'.format(name, value) for name, value in options)
+        processes.append(((balance_id_min, balance_id_max),
+                          subprocess.Popen(['irule', '-r', 'irods_rule_engine_plugin-irods_rule_language-instance',
+                                            rule_name, rule_options, 'ruleExecOut'])))
+
+    succeeded = True
+    for (balance_id_min, balance_id_max), process in processes:
+        returncode = process.wait()
+        if returncode != 0:
+            print('error: batch job for balance id range {}-{} failed with exit code {}'.format(balance_id_min, balance_id_max, returncode),
+                  file=sys.stderr)
+            succeeded = False
+    return succeeded
+
+
 args = get_args()
 lock_or_die(args.balance_id_min, args.balance_id_max)
-rule_options = "*verbose={}%*balance_id_min={}%*balance_id_max={}%*batch_size_limit={}%*dry_run={}".format(args.verbose, args.balance_id_min, args.balance_id_max, args.batch_size_limit, args.dry_run)
-subprocess.call(['irule', '-r', 'irods_rule_engine_plugin-irods_rule_language-instance',
-                rule_name, rule_options, 'ruleExecOut'])
+
+if args.daemon:
+    # Failed batch jobs are reported and retried in the next run.
+    while True:
+        run_once(args)
+        time.sleep(args.interval)
+elif not run_once(args):
+    exit(1)
@@ -0,0 +1,23 @@
+processTempWritePermissionBatch() {
+
+	if (*permission == "grant") {
+		*acl = "write";
+	} else if (*permission == "grantread") {
+		*acl = "read";
+	} else if (*permission == "own") {
+		*acl = "own";
+	} else if (*permission == "revoke") {
+		*acl = "null";
+	} else {
+		writeLine("stdout", "processTempWritePermissionBatch: invalid permission value");
+		*status = "InternalError";
+		*statusInfo = "";
+		succeed;
+	}
+
+	foreach(*doc in split(*docs, "/")) {
+		msiSetACL("default", *acl, *user, *collPath ++ "/" ++ *doc);
+	}
+}
+input *actor="", *collPath="", *permission="", *docs="", *user=""
+output ruleExecOut
@@ -9,11 +9,23 @@ from unittest import TestCase
 
 sys.path.append('../util')
 
-from misc import human_readable_size
+from misc import bool_from_string, human_readable_size
 
 
 class UtilMiscTest(TestCase):
 
+    def test_bool_from_string(self):
+        self.assertIs(bool_from_string("true"), True)
+        self.assertIs(bool_from_string("True"), True)
+        self.assertIs(bool_from_string("false"), False)
+        self.assertIs(bool_from_string("FALSE"), False)
+        self.assertIs(bool_from_string(True), True)
+        self.assertIs(bool_from_string(False), False)
+        self.assertEquals(bool_from_string("yes"), "yes")
+        self.assertEquals(bool_from_string(""), "")
+        self.assertEquals(bool_from_string(1), 1)
+        self.assertIsNone(bool_from_string(None))
+
     def test_human_readable_size(self):
         output = human_readable_size(0)
         self.assertEquals(output, "0 B")
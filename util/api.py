@@ -15,6 +15,7 @@ from collections import OrderedDict
 
 import jsonutil
 import log
+import misc
 import rule
 from config import config
 from error import *
@@ -104,6 +105,11 @@ def _api(f):
     # If the function accepts **kwargs, we do not forbid extra arguments.
     allow_extra = a_kw is not None
 
+    # Optional arguments with a boolean default value also accept "true" and "false" strings, as
+    # some callers are not able to pass actual booleans.
+    boolean = set([] if a_defaults is None else
+                  [name for name, default in zip(a_pos[-len(a_defaults):], a_defaults) if type(default) is bool])
+
     def wrapper(ctx, inp):
         """A function that receives a JSON string and calls a wrapped function with unpacked arguments.
 
@@ -157,6 +163,11 @@ def _api(f):
                     return bad_request('Unrecognized argument: {} (required: [{}]  optional: [{}])'
                                        .format(param, ', '.join(required), ', '.join(optional))).as_dict()
 
+        # Convert boolean arguments passed as strings to booleans.
+        for param in boolean:
+            if param in data:
+                data[param] = misc.bool_from_string(data[param])
+
         # Try to run the function with the supplied arguments,
         # catching any error it throws.
         try:
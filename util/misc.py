@@ -7,6 +7,18 @@ __license__   = 'GPLv3, see LICENSE'
 import math
 
 
+def bool_from_string(value):
+    """Convert a "true" or "false" string (case-insensitive) to a boolean.
+
+    :param value: Value to convert
+
+    :returns: Boolean if value is a "true" or "false" string, otherwise value unchanged
+    """
+    if isinstance(value, str) and value.lower() in ('true', 'false'):
+        return value.lower() == 'true'
+    return value
+
+
 def human_readable_size(size_bytes):
     if size_bytes == 0:
         return "0 B"
@@ -99,6 +99,21 @@ adminTempWritePermission(*path, *permission, *user) {
 }
 
 
+# \brief Grant or revoke temporary permissions on several files of a
+#        collection for a given user in a single admin invocation
+#
+# \param[in] collPath    Collection containing the files
+# \param[in] permission  Permission to grant or revoke
+# \param[in] docs        Names of the files in collPath, separated by "/" (which
+#                        cannot occur in a data object name)
+# \param[in] user        User to grant or revoke the permission for
+#
+adminTempWritePermissionBatch(*collPath, *permission, *docs, *user) {
+        *argv = uuClientFullName ++ " *collPath *permission *docs *user";
+        msiExecCmd("admin-datarequest-temp-write-permission-batch.sh", *argv, "", "", 0, *out);
+}
+
+
 # \brief Process request to change data request metadata
 #
 # \param[in] requestColl                   Collection of the data request whose